@@ -4,13 +4,14 @@ from __future__ import annotations
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .auth import fastapi_users
 from .database import get_async_session
 from .models import User
-from .schemas import UserRead
+from .replicas import get_read_session
+from .schemas import BulkItemResult, BulkResult, UserBulkAction, UserRead
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -19,7 +20,7 @@ current_active_superuser = fastapi_users.current_user(active=True, superuser=Tru
 
 @router.get("/users", response_model=list[UserRead])
 async def list_users(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(current_active_superuser),
 ) -> list[User]:
     """Return every user for admin consumption."""
@@ -49,6 +50,70 @@ async def verify_user(
     return user
 
 
+@router.post("/users/bulk-verify", response_model=BulkResult)
+async def bulk_verify_users(
+    payload: UserBulkAction,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_active_superuser),
+) -> BulkResult:
+    """Verify many users with a single UPDATE."""
+
+    ids = list(dict.fromkeys(payload.ids))
+    result = await session.execute(
+        update(User)
+        .where(User.id.in_(ids), User.is_verified.is_(False))
+        .values(is_verified=True)
+        .returning(User.id, User.email)
+        .execution_options(synchronize_session=False)
+    )
+    verified = {row.id: row.email for row in result}
+    already = {
+        row.id: row.email
+        for row in await session.execute(select(User.id, User.email).where(User.id.in_(ids), User.is_verified.is_(True)))
+        if row.id not in verified
+    }
+    await session.commit()
+
+    results = []
+    for user_id in ids:
+        if user_id in verified:
+            results.append(BulkItemResult(value=verified[user_id], status="verified", id=user_id))
+        elif user_id in already:
+            results.append(BulkItemResult(value=already[user_id], status="already_verified", id=user_id))
+        else:
+            results.append(BulkItemResult(value=str(user_id), status="not_found", id=user_id))
+    return BulkResult(processed=len(results), succeeded=len(verified), results=results)
+
+
+@router.post("/users/bulk-delete", response_model=BulkResult)
+async def bulk_delete_users(
+    payload: UserBulkAction,
+    session: AsyncSession = Depends(get_async_session),
+    admin: User = Depends(current_active_superuser),
+) -> BulkResult:
+    """Remove many user accounts with a single DELETE; the caller's own account is skipped."""
+
+    ids = list(dict.fromkeys(payload.ids))
+    result = await session.execute(
+        delete(User)
+        .where(User.id.in_([user_id for user_id in ids if user_id != admin.id]))
+        .returning(User.id, User.email)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = {row.id: row.email for row in result}
+    await session.commit()
+
+    results = []
+    for user_id in ids:
+        if user_id == admin.id:
+            results.append(BulkItemResult(value=admin.email, status="skipped", id=user_id))
+        elif user_id in deleted:
+            results.append(BulkItemResult(value=deleted[user_id], status="deleted", id=user_id))
+        else:
+            results.append(BulkItemResult(value=str(user_id), status="not_found", id=user_id))
+    return BulkResult(processed=len(results), succeeded=len(deleted), results=results)
+
+
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: uuid.UUID,
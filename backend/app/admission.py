@@ -0,0 +1,178 @@
+"""Admission control for expensive endpoints.
+
+Heavy jobs (scrapes, searches) pass through an :class:`AdmissionLimiter`
+before they start: token buckets cap how often a user (and everyone together)
+may start one, a per-user cap bounds concurrent jobs, and a global cap with a
+short bounded queue sheds excess load with 429/503 instead of letting it pile
+up. The jobs themselves run on a dedicated thread pool so they never occupy
+the threads that serve ordinary requests.
+
+Limits are per process; with several uvicorn workers the effective global
+limits scale with the worker count.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import ParamSpec, TypeVar
+
+from fastapi import HTTPException, status
+
+from .config import get_settings
+
+settings = get_settings()
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MAX_TRACKED_USERS = 10_000
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def wait(self) -> float:
+        """Seconds until a token is available (0 when one is), without consuming it."""
+
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else math.inf
+
+    def take(self) -> float:
+        """Consume a token; returns 0 on success or the seconds until one is available."""
+
+        wait = self.wait()
+        if not wait:
+            self.tokens -= 1
+        return wait
+
+
+def _reject(status_code: int, detail: str, retry_after: float) -> HTTPException:
+    seconds = 60 if math.isinf(retry_after) else max(math.ceil(retry_after), 1)
+    return HTTPException(status_code=status_code, detail=detail, headers={"Retry-After": str(seconds)})
+
+
+class AdmissionLimiter:
+    """Rate, concurrency and queue limits for one class of expensive work."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_concurrent_per_user: int,
+        queue_size: int,
+        queue_timeout: float,
+        rate_per_minute: float,
+        user_rate_per_minute: float,
+        burst: int,
+    ) -> None:
+        self.name = name
+        self.max_concurrent_per_user = max_concurrent_per_user
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.user_rate = user_rate_per_minute / 60
+        self.burst = burst
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._global_bucket = TokenBucket(rate_per_minute / 60, max(burst, max_concurrent))
+        self._user_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._running: dict[str, int] = {}
+
+    def _user_bucket(self, user_key: str) -> TokenBucket:
+        bucket = self._user_buckets.pop(user_key, None) or TokenBucket(self.user_rate, self.burst)
+        self._user_buckets[user_key] = bucket
+        while len(self._user_buckets) > MAX_TRACKED_USERS:
+            self._user_buckets.popitem(last=False)
+        return bucket
+
+    def _check_rate(self, user_key: str) -> None:
+        if self._running.get(user_key, 0) >= self.max_concurrent_per_user:
+            raise _reject(
+                status.HTTP_429_TOO_MANY_REQUESTS, f"A {self.name} job of yours is already running.", self.queue_timeout
+            )
+        # Check both buckets before taking from either, so a request shed by
+        # the global limit does not also use up the user's quota.
+        user_bucket = self._user_bucket(user_key)
+        wait = user_bucket.wait()
+        if wait:
+            raise _reject(status.HTTP_429_TOO_MANY_REQUESTS, f"Too many {self.name} requests; slow down.", wait)
+        wait = self._global_bucket.wait()
+        if wait:
+            raise _reject(status.HTTP_503_SERVICE_UNAVAILABLE, f"The {self.name} service is busy.", wait)
+        user_bucket.take()
+        self._global_bucket.take()
+
+    async def _acquire_slot(self) -> None:
+        if self._slots.locked() and self._waiting >= self.queue_size:
+            raise _reject(status.HTTP_503_SERVICE_UNAVAILABLE, f"The {self.name} queue is full.", self.queue_timeout)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except TimeoutError:
+            raise _reject(
+                status.HTTP_503_SERVICE_UNAVAILABLE, f"Timed out waiting for a {self.name} slot.", self.queue_timeout
+            ) from None
+        finally:
+            self._waiting -= 1
+
+    @asynccontextmanager
+    async def slot(self, user_key: str) -> AsyncIterator[None]:
+        """Hold one admitted job for ``user_key``; raises 429/503 when shedding."""
+
+        self._check_rate(user_key)
+        self._running[user_key] = self._running.get(user_key, 0) + 1
+        try:
+            await self._acquire_slot()
+            try:
+                yield
+            finally:
+                self._slots.release()
+        finally:
+            self._running[user_key] -= 1
+            if not self._running[user_key]:
+                del self._running[user_key]
+
+
+scrape_limiter = AdmissionLimiter(
+    "scrape",
+    max_concurrent=settings.scrape_max_concurrent,
+    max_concurrent_per_user=settings.scrape_max_concurrent_per_user,
+    queue_size=settings.scrape_queue_size,
+    queue_timeout=settings.scrape_queue_timeout,
+    rate_per_minute=settings.scrape_rate_per_minute,
+    user_rate_per_minute=settings.scrape_user_rate_per_minute,
+    burst=settings.scrape_rate_burst,
+)
+
+_scrape_executor: ThreadPoolExecutor | None = None
+
+
+def scrape_executor() -> ThreadPoolExecutor:
+    """Thread pool reserved for blocking scrape work (created on first use)."""
+
+    global _scrape_executor
+    if _scrape_executor is None:
+        _scrape_executor = ThreadPoolExecutor(max_workers=settings.scrape_max_concurrent, thread_name_prefix="scrape")
+    return _scrape_executor
+
+
+async def run_scrape_job(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run blocking scrape code on the dedicated pool instead of the shared one."""
+
+    return await asyncio.get_running_loop().run_in_executor(scrape_executor(), partial(func, *args, **kwargs))
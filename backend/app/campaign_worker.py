@@ -0,0 +1,56 @@
+"""Standalone campaign sender: ``python -m app.campaign_worker``.
+
+Senders coordinate through delivery leases in the database, so several can
+drain the outbox side by side and a restarted one resumes where it stopped.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from . import mailer
+from .campaigns import claim_deliveries, send_deliveries
+from .config import get_settings
+from .database import async_session_maker
+from .leases import new_node_id
+
+settings = get_settings()
+
+
+async def run_sender(node_id: str, batch_size: int, lease_seconds: int, poll_seconds: float, once: bool) -> None:
+    """Send batches forever, idling ``poll_seconds`` when the outbox is empty."""
+
+    async with async_session_maker() as session:
+        while True:
+            batch = await claim_deliveries(session, node_id, batch_size, lease_seconds)
+            if not batch:
+                if once:
+                    return
+                await asyncio.sleep(poll_seconds)
+                continue
+            result = await send_deliveries(session, node_id, batch, settings.campaign_max_attempts, lease_seconds)
+            print(
+                f"[{node_id}] {result.deliveries} deliveries: {result.sent} sent, "
+                f"{result.bounced} bounced, {result.failed} failed, {result.retried} requeued",
+                flush=True,
+            )
+            if result.retried == result.deliveries:
+                await asyncio.sleep(poll_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drain the campaign outbox over SMTP.")
+    parser.add_argument("--node-id", default=new_node_id())
+    parser.add_argument("--batch-size", type=int, default=settings.campaign_batch_size)
+    parser.add_argument("--lease-seconds", type=int, default=settings.campaign_lease_seconds)
+    parser.add_argument("--poll-seconds", type=float, default=settings.campaign_poll_seconds)
+    parser.add_argument("--once", action="store_true", help="exit when the outbox is empty")
+    args = parser.parse_args()
+
+    if not mailer.is_configured():
+        parser.error("set SMTP_HOST and SMTP_FROM (or SMTP_USERNAME) before sending campaigns")
+    asyncio.run(run_sender(args.node_id, args.batch_size, args.lease_seconds, args.poll_seconds, args.once))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+"""Campaign outbox: per-recipient delivery rows drained by sender nodes.
+
+Enqueueing copies the template into a ``campaigns`` row and fills
+``campaign_deliveries`` with one ``INSERT ... SELECT`` over the matching
+``EmailRecord`` rows. Senders lease batches in id order and commit each
+delivery's outcome as soon as the SMTP server answers, so a crashed or
+restarted sender resumes with exactly the rows that were never confirmed (at
+most the one message in flight is sent again).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import uuid
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import Uuid, and_, case, exists, func, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import etags, mailer, stats
+from .config import get_settings
+from .database import async_session_maker
+from .leases import utcnow
+from .models import Campaign, CampaignDelivery, EmailRecord, EmailTemplate
+from .schemas import CampaignCreate
+
+settings = get_settings()
+
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+BOUNCED = "bounced"
+STATUSES = (QUEUED, SENDING, SENT, FAILED, BOUNCED)
+
+
+@dataclass(frozen=True)
+class ClaimedDelivery:
+    id: int
+    campaign_id: uuid.UUID
+    email: str
+
+
+@dataclass
+class SendResult:
+    deliveries: int = 0
+    sent: int = 0
+    bounced: int = 0
+    failed: int = 0
+    retried: int = 0
+    # Recipients whose send_count went from 0 to 1.
+    first_sends: int = 0
+
+
+def recipient_filter(payload: CampaignCreate | None) -> list:
+    clauses = []
+    if payload is None:
+        return clauses
+    if payload.contains:
+        clauses.append(func.lower(EmailRecord.email).contains(payload.contains.lower(), autoescape=True))
+    if payload.created_before is not None:
+        clauses.append(EmailRecord.created_at < payload.created_before)
+    if payload.never_sent:
+        clauses.append(EmailRecord.send_count == 0)
+    return clauses
+
+
+def content_key(template: EmailTemplate, payload: CampaignCreate | None) -> str:
+    recipients = payload.model_dump(mode="json") if payload is not None else {}
+    data = json.dumps([template.subject, template.body, recipients], sort_keys=True)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def find_duplicate(session: AsyncSession, idempotency_key: str | None, key: str) -> Campaign | None:
+    """The campaign a repeated request refers to: the one created with the same
+    ``idempotency_key``, or else an identical campaign that is still sending."""
+
+    if idempotency_key is not None:
+        stmt = select(Campaign).where(Campaign.idempotency_key == idempotency_key)
+        campaign = (await session.execute(stmt)).scalars().first()
+        if campaign is not None:
+            return campaign
+    stmt = (
+        select(Campaign)
+        .where(Campaign.content_key == key, Campaign.completed_at.is_(None))
+        .order_by(Campaign.created_at.desc())
+        .limit(1)
+    )
+    return (await session.execute(stmt)).scalars().first()
+
+
+async def enqueue_campaign(
+    session: AsyncSession,
+    template: EmailTemplate,
+    payload: CampaignCreate | None = None,
+    idempotency_key: str | None = None,
+) -> tuple[Campaign, bool]:
+    """Create a campaign and queue one delivery per matching email record.
+
+    Returns ``(campaign, created)``; a repeated request (see
+    :func:`find_duplicate`) gets the existing campaign back instead of queueing
+    every recipient a second time.
+    """
+
+    key = content_key(template, payload)
+    existing = await find_duplicate(session, idempotency_key, key)
+    if existing is not None:
+        return existing, False
+
+    campaign = Campaign(
+        id=uuid.uuid4(),
+        subject=template.subject,
+        body=template.body,
+        idempotency_key=idempotency_key,
+        content_key=key,
+    )
+    session.add(campaign)
+    try:
+        await session.flush()
+    except IntegrityError:
+        # A concurrent request with the same Idempotency-Key won the race.
+        await session.rollback()
+        existing = await find_duplicate(session, idempotency_key, key)
+        if existing is None:
+            raise
+        return existing, False
+
+    recipients = select(
+        literal(campaign.id, Uuid()),
+        EmailRecord.id,
+        EmailRecord.email,
+        literal(QUEUED),
+        literal(0),
+    ).where(*recipient_filter(payload))
+    result = await session.execute(
+        CampaignDelivery.__table__.insert().from_select(
+            ["campaign_id", "email_record_id", "email", "status", "attempts"], recipients
+        )
+    )
+    campaign.total_recipients = max(result.rowcount, 0)
+    if not campaign.total_recipients:
+        campaign.completed_at = utcnow()
+    await stats.bump(session, {stats.EMAIL_SEND_RUNS: 1})
+    await session.commit()
+    return campaign, True
+
+
+def _claimable(now: datetime):
+    return or_(
+        CampaignDelivery.status == QUEUED,
+        and_(CampaignDelivery.status == SENDING, CampaignDelivery.lease_expires_at < now),
+    )
+
+
+async def claim_deliveries(
+    session: AsyncSession, node_id: str, batch_size: int, lease_seconds: int
+) -> list[ClaimedDelivery]:
+    """Lease the oldest unsent deliveries to ``node_id`` (``SKIP LOCKED`` on PostgreSQL)."""
+
+    now = utcnow()
+    candidates = (
+        select(CampaignDelivery.id)
+        .where(_claimable(now))
+        .order_by(CampaignDelivery.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(CampaignDelivery)
+        .where(CampaignDelivery.id.in_(candidates.scalar_subquery()), _claimable(now))
+        .values(
+            status=SENDING,
+            lease_owner=node_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            attempts=CampaignDelivery.attempts + 1,
+        )
+        .returning(CampaignDelivery.id, CampaignDelivery.campaign_id, CampaignDelivery.email)
+        .execution_options(synchronize_session=False)
+    )
+    rows = (await session.execute(stmt)).all()
+    await session.commit()
+    return sorted(
+        (ClaimedDelivery(id=row.id, campaign_id=row.campaign_id, email=row.email) for row in rows),
+        key=lambda delivery: delivery.id,
+    )
+
+
+def _owned(node_id: str, delivery_ids: Sequence[int]):
+    return and_(
+        CampaignDelivery.id.in_(delivery_ids),
+        CampaignDelivery.lease_owner == node_id,
+        CampaignDelivery.status == SENDING,
+    )
+
+
+async def renew_leases(
+    session: AsyncSession, node_id: str, delivery_ids: Sequence[int], lease_seconds: int
+) -> set[int]:
+    """Extend the leases this node still holds; returns the ids it still owns."""
+
+    rows = await session.execute(
+        update(CampaignDelivery)
+        .where(_owned(node_id, delivery_ids))
+        .values(lease_expires_at=utcnow() + timedelta(seconds=lease_seconds))
+        .returning(CampaignDelivery.id)
+        .execution_options(synchronize_session=False)
+    )
+    owned = set(rows.scalars())
+    await session.commit()
+    return owned
+
+
+async def record_outcomes(
+    session: AsyncSession,
+    node_id: str,
+    batch: Sequence[ClaimedDelivery],
+    outcomes: Sequence[mailer.Outcome],
+    max_attempts: int,
+) -> SendResult:
+    """Persist the outcome of every delivery in the batch in one transaction.
+
+    Only rows still leased to ``node_id`` are touched, so a late report for a
+    batch another node reclaimed is ignored. Dashboard counters and the email
+    list version are left to :func:`record_totals`, once per batch.
+    """
+
+    now = utcnow()
+    groups: dict[tuple[str, str | None], list[int]] = defaultdict(list)
+    for delivery, outcome in zip(batch, outcomes):
+        groups[(outcome.status, outcome.error)].append(delivery.id)
+
+    result = SendResult(deliveries=len(batch))
+    sent_records: list[uuid.UUID] = []
+    for (status, error), delivery_ids in groups.items():
+        released = {"lease_owner": None, "lease_expires_at": None, "last_error": error}
+        if status == mailer.SENT:
+            stmt = update(CampaignDelivery).values(status=SENT, sent_at=now, **released)
+        elif status == mailer.BOUNCED:
+            stmt = update(CampaignDelivery).values(status=BOUNCED, **released)
+        else:
+            stmt = update(CampaignDelivery).values(
+                status=case((CampaignDelivery.attempts >= max_attempts, FAILED), else_=QUEUED), **released
+            )
+        rows = (
+            await session.execute(
+                stmt.where(_owned(node_id, delivery_ids))
+                .returning(CampaignDelivery.status, CampaignDelivery.email_record_id)
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+        for row in rows:
+            if row.status == SENT:
+                result.sent += 1
+                if row.email_record_id is not None:
+                    sent_records.append(row.email_record_id)
+            elif row.status == BOUNCED:
+                result.bounced += 1
+            elif row.status == FAILED:
+                result.failed += 1
+            else:
+                result.retried += 1
+
+    if sent_records:
+        counts = await session.execute(
+            update(EmailRecord)
+            .where(EmailRecord.id.in_(sent_records))
+            .values(send_count=EmailRecord.send_count + 1, last_sent_at=now)
+            .returning(EmailRecord.send_count)
+            .execution_options(synchronize_session=False)
+        )
+        result.first_sends = sum(1 for (send_count,) in counts if send_count == 1)
+
+    pending = exists().where(
+        CampaignDelivery.campaign_id == Campaign.id, CampaignDelivery.status.in_((QUEUED, SENDING))
+    )
+    await session.execute(
+        update(Campaign)
+        .where(Campaign.id.in_({delivery.campaign_id for delivery in batch}), Campaign.completed_at.is_(None), ~pending)
+        .values(completed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result
+
+
+async def record_totals(session: AsyncSession, total: SendResult) -> None:
+    """Apply a batch's sends to the dashboard counters and the email list version.
+
+    Done once per batch so the ``/emails`` ETag does not change with every
+    message. Stats are locked before ``resource_versions``, the same order the
+    email delete endpoints use.
+    """
+
+    if not total.sent:
+        return
+    await stats.bump(
+        session,
+        {stats.EMAILS_SENT: total.first_sends, stats.MESSAGES_SENT: total.sent},
+        growth={stats.MESSAGES_SENT: total.sent},
+    )
+    await etags.bump_versions(session, etags.EMAILS)
+    await session.commit()
+
+
+def _add(total: SendResult, result: SendResult) -> None:
+    total.deliveries += result.deliveries
+    total.sent += result.sent
+    total.bounced += result.bounced
+    total.failed += result.failed
+    total.retried += result.retried
+    total.first_sends += result.first_sends
+
+
+async def send_deliveries(
+    session: AsyncSession, node_id: str, batch: Sequence[ClaimedDelivery], max_attempts: int, lease_seconds: int
+) -> SendResult:
+    """Send a claimed batch over one SMTP connection, recording each outcome as it arrives.
+
+    The leases of the unsent rows are renewed before every message, so a slow
+    SMTP server cannot outlast them; a row another sender has reclaimed in the
+    meantime is skipped rather than sent twice. Counters are applied once at
+    the end, also when the batch stops early.
+    """
+
+    campaign_ids = {delivery.campaign_id for delivery in batch}
+    campaigns = {
+        row.id: row
+        for row in await session.execute(
+            select(Campaign.id, Campaign.subject, Campaign.body).where(Campaign.id.in_(campaign_ids))
+        )
+    }
+
+    total = SendResult()
+    connection = mailer.Connection()
+    await asyncio.to_thread(connection.open)
+    try:
+        for index, delivery in enumerate(batch):
+            if connection.error is not None:
+                # Hand the rest back in one statement instead of one per row.
+                rest = batch[index:]
+                outcome = mailer.Outcome(mailer.RETRY, connection.error)
+                _add(total, await record_outcomes(session, node_id, rest, [outcome] * len(rest), max_attempts))
+                break
+            if delivery.id not in await renew_leases(
+                session, node_id, [pending.id for pending in batch[index:]], lease_seconds
+            ):
+                continue
+            campaign = campaigns[delivery.campaign_id]
+            outgoing = mailer.Outgoing(delivery.email, f"<campaign-{delivery.campaign_id}-{delivery.id}@sponsor-bot>")
+            outcome = await asyncio.to_thread(connection.send, campaign.subject, campaign.body, outgoing)
+            _add(total, await record_outcomes(session, node_id, [delivery], [outcome], max_attempts))
+    finally:
+        await asyncio.to_thread(connection.close)
+        # Drop a half-done statement first so the sends already committed are counted.
+        await session.rollback()
+        await record_totals(session, total)
+    return total
+
+
+async def drain_outbox(
+    session: AsyncSession,
+    node_id: str,
+    batch_size: int | None = None,
+    lease_seconds: int | None = None,
+) -> SendResult:
+    """Send batches until no deliverable row is left."""
+
+    batch_size = batch_size or settings.campaign_batch_size
+    lease_seconds = lease_seconds or settings.campaign_lease_seconds
+    total = SendResult()
+    while batch := await claim_deliveries(session, node_id, batch_size, lease_seconds):
+        result = await send_deliveries(session, node_id, batch, settings.campaign_max_attempts, lease_seconds)
+        _add(total, result)
+        if result.retried == result.deliveries:
+            # Nothing went through (SMTP down?): leave the rest for a later run.
+            break
+    return total
+
+
+async def drain_outbox_in_background(node_id: str) -> None:
+    async with async_session_maker() as session:
+        await drain_outbox(session, node_id)
+
+
+async def campaign_progress(session: AsyncSession, campaign_ids: Sequence[uuid.UUID]) -> dict[uuid.UUID, dict[str, int]]:
+    """Delivery counts per status for each campaign (one indexed GROUP BY)."""
+
+    progress: dict[uuid.UUID, dict[str, int]] = {
+        campaign_id: dict.fromkeys(STATUSES, 0) for campaign_id in campaign_ids
+    }
+    if not campaign_ids:
+        return progress
+    result = await session.execute(
+        select(CampaignDelivery.campaign_id, CampaignDelivery.status, func.count())
+        .where(CampaignDelivery.campaign_id.in_(campaign_ids))
+        .group_by(CampaignDelivery.campaign_id, CampaignDelivery.status)
+    )
+    for campaign_id, status, count in result:
+        progress[campaign_id][status] = count
+    return progress
@@ -14,7 +14,42 @@ class Settings(BaseSettings):
     secret_key: str = "change-this-in-production"
     access_token_expire_minutes: int = 60 * 24
     database_url: Optional[str] = None
+    # Comma-separated read replica DSNs (see app.replicas)
+    database_replica_urls: Optional[str] = None
+    replica_health_interval: float = 5.0
+    replica_max_lag_seconds: Optional[float] = None
+    read_your_writes_seconds: float = 5.0
     front_end_dist: str = "frontend/dist"
+    compression_minimum_size: int = 1024
+
+    # Distributed scraping (see app.scrape_leases / app.scrape_worker)
+    scrape_batch_size: int = 25
+    scrape_lease_seconds: int = 300
+    scrape_poll_seconds: float = 10.0
+    scrape_max_page_bytes: int = 1_000_000
+    scrape_fetch_timeout: float = 15.0
+    # Admission control for scrape/search jobs, per process (see app.admission)
+    scrape_max_concurrent: int = 4
+    scrape_max_concurrent_per_user: int = 1
+    scrape_queue_size: int = 8
+    scrape_queue_timeout: float = 30.0
+    scrape_rate_per_minute: float = 30.0
+    scrape_user_rate_per_minute: float = 6.0
+    scrape_rate_burst: int = 3
+    # Page fingerprint store (hashes of already extracted pages)
+    fingerprint_store_size: int = 50_000
+
+    # Campaign outbox (see app.campaigns / app.campaign_worker)
+    campaign_batch_size: int = 100
+    campaign_lease_seconds: int = 300
+    campaign_poll_seconds: float = 10.0
+    campaign_max_attempts: int = 3
+    smtp_host: Optional[str] = None
+    smtp_port: int = 587
+    smtp_username: Optional[str] = None
+    smtp_password: Optional[str] = None
+    smtp_from: Optional[str] = None
+    smtp_starttls: bool = True
 
     # Azure Database for PostgreSQL specific overrides
     azure_pg_host: Optional[str] = None
@@ -48,10 +83,16 @@ class Settings(BaseSettings):
 
         return self.database_url or self._build_azure_database_url() or "sqlite+aiosqlite:///./app.db"
 
-    def sqlalchemy_connect_args(self) -> dict[str, object]:
+    @property
+    def replica_urls(self) -> list[str]:
+        """Read replica connection strings, empty when reads go to the primary."""
+
+        return [url.strip() for url in (self.database_replica_urls or "").split(",") if url.strip()]
+
+    def sqlalchemy_connect_args(self, url: Optional[str] = None) -> dict[str, object]:
         """Provide SSL connect args for Azure PostgreSQL when required."""
 
-        if not self.resolved_database_url.startswith("postgresql"):
+        if not (url or self.resolved_database_url).startswith("postgresql"):
             return {}
 
         if not self.azure_pg_require_ssl:
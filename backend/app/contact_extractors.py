@@ -0,0 +1,251 @@
+"""Pluggable contact extractors that share one parsed view of each page.
+
+A page is parsed once into a :class:`ParsedPage` (visible text, email-bearing
+attributes, link targets and structured data) and the extractors read from
+those shared views, so collecting another contact field never costs another
+fetch or parse. Only the email extractor also scans the raw markup, because
+addresses hide in scripts and attribute values too.
+Extractors are registered with :func:`register_extractor`; the email extractor
+lives in :mod:`app.scrape_email_extractor` because it needs the optional
+``extract_emails`` dependency, everything here is stdlib only.
+"""
+from __future__ import annotations
+
+import html
+import json
+import logging
+import re
+from collections.abc import Callable, Iterable
+from functools import cached_property
+from typing import NamedTuple, Protocol
+
+EMAIL = "email"
+PHONE = "phone"
+SOCIAL = "social"
+NAME = "name"
+
+_SCRIPT_STYLE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_EMAIL_ATTRIBUTE = re.compile(r"""(?:data-cfemail=["']?([0-9a-fA-F]+)|mailto:([^"'>\s?]+))""")
+_HREF = re.compile(r"""\bhref\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_JSON_LD = re.compile(
+    r"""<script[^>]+type\s*=\s*["']application/ld\+json["'][^>]*>(.*?)</script\s*>""", re.IGNORECASE | re.DOTALL
+)
+_META_AUTHOR = re.compile(
+    r"""<meta\s+[^>]*name\s*=\s*["']author["'][^>]*content\s*=\s*["']([^"']+)["']""", re.IGNORECASE
+)
+
+# Digit runs that look like phone numbers; text matches also need a leading
+# "+" or a nearby keyword, otherwise dates, prices and IDs would qualify.
+_PHONE = re.compile(r"(?<![\w+])(\+?\(?\d[\d\s().-]{6,20}\d)(?![\w])")
+_PHONE_KEYWORD = re.compile(r"(?:phone|tel|call|mobile|cell|whatsapp|טלפון|נייד|טל)[\s.:]*$", re.IGNORECASE)
+_PHONE_KEYWORD_WINDOW = 24
+MIN_PHONE_DIGITS = 9
+MAX_PHONE_DIGITS = 15
+
+SOCIAL_PROFILES: dict[str, tuple[str, re.Pattern[str]]] = {
+    "linkedin": ("www.linkedin.com", re.compile(r"linkedin\.com/((?:in|company)/[\w%.-]+)", re.IGNORECASE)),
+    "twitter": (
+        "x.com",
+        re.compile(r"(?:twitter|x)\.com/(?!(?:share|intent|home|search|hashtag)\b)(\w{1,15})(?:[/?#]|$)", re.IGNORECASE),
+    ),
+    "facebook": (
+        "www.facebook.com",
+        re.compile(r"facebook\.com/(?!(?:sharer|share|dialog|plugins|tr)\b)([\w.-]{3,})(?:[/?#]|$)", re.IGNORECASE),
+    ),
+    "instagram": (
+        "www.instagram.com",
+        re.compile(r"instagram\.com/(?!(?:p|explore|reel|stories)\b)([\w.]{1,30})(?:[/?#]|$)", re.IGNORECASE),
+    ),
+    "youtube": (
+        "www.youtube.com",
+        re.compile(r"youtube\.com/(@[\w.-]+|(?:c|channel|user)/[\w.-]+)", re.IGNORECASE),
+    ),
+    "tiktok": ("www.tiktok.com", re.compile(r"tiktok\.com/(@[\w.]+)", re.IGNORECASE)),
+}
+
+MAX_NAME_LENGTH = 80
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractedContact(NamedTuple):
+    """One contact detail; ``label`` qualifies it (platform, job title...)."""
+
+    kind: str
+    value: str
+    label: str | None = None
+
+
+def visible_text(page_source: str) -> str:
+    """Text outside tags, scripts, styles and comments, whitespace-collapsed."""
+
+    text = _COMMENT.sub(" ", _SCRIPT_STYLE.sub(" ", page_source))
+    return _WHITESPACE.sub(" ", _TAG.sub(" ", text)).strip()
+
+
+def email_attributes(page_source: str) -> list[tuple[str, str]]:
+    """``(data-cfemail, mailto)`` pairs, one side set per match, from the raw HTML."""
+
+    return _EMAIL_ATTRIBUTE.findall(page_source)
+
+
+class ParsedPage:
+    """A fetched page parsed once; derived views are computed on first use.
+
+    Extractors read these views rather than :attr:`html`, so each one costs a
+    single scan of the page however many extractors use it.
+    """
+
+    def __init__(self, page_source: str) -> None:
+        self.html = page_source
+        self.visible = visible_text(page_source)
+
+    @cached_property
+    def text(self) -> str:
+        """Visible text with HTML entities decoded."""
+
+        return html.unescape(self.visible)
+
+    @cached_property
+    def email_attributes(self) -> list[tuple[str, str]]:
+        return email_attributes(self.html)
+
+    @cached_property
+    def links(self) -> list[str]:
+        return [html.unescape(href).strip() for href in _HREF.findall(self.html)]
+
+    @cached_property
+    def meta_authors(self) -> list[str]:
+        return [html.unescape(author) for author in _META_AUTHOR.findall(self.html)]
+
+    @cached_property
+    def json_ld(self) -> list[object]:
+        """Parsed ``application/ld+json`` blocks; malformed ones are dropped."""
+
+        blocks = []
+        for block in _JSON_LD.findall(self.html):
+            try:
+                blocks.append(json.loads(block))
+            except ValueError:
+                continue
+        return blocks
+
+
+class ContactExtractor(Protocol):
+    kind: str
+
+    def extract_contacts(self, page: ParsedPage) -> set[ExtractedContact]: ...
+
+
+_registry: list[Callable[[], ContactExtractor]] = []
+
+
+def register_extractor(factory: Callable[[], ContactExtractor]) -> Callable[[], ContactExtractor]:
+    """Add an extractor factory (usually the class) to every new pipeline; usable as a decorator."""
+
+    if factory not in _registry:
+        _registry.append(factory)
+    return factory
+
+
+def registered_extractors() -> list[ContactExtractor]:
+    """Fresh instances of every registered extractor."""
+
+    return [factory() for factory in _registry]
+
+
+def run_extractors(page: ParsedPage, extractors: Iterable[ContactExtractor]) -> set[ExtractedContact]:
+    """Union of every extractor's contacts; an extractor that raises is logged and
+    skipped, so one malformed page cannot fail the whole scrape batch."""
+
+    contacts: set[ExtractedContact] = set()
+    for extractor in extractors:
+        try:
+            contacts |= extractor.extract_contacts(page)
+        except Exception:
+            logger.exception("%s extractor failed on a page; skipping it", extractor.kind)
+    return contacts
+
+
+def normalize_phone(raw: str) -> str | None:
+    digits = re.sub(r"\D", "", raw)
+    if not MIN_PHONE_DIGITS <= len(digits) <= MAX_PHONE_DIGITS:
+        return None
+    return f"+{digits}" if raw.lstrip("( ").startswith("+") else digits
+
+
+@register_extractor
+class PhoneExtractor:
+    """``tel:`` links plus international or keyword-labelled numbers in the text."""
+
+    kind = PHONE
+
+    def extract_contacts(self, page: ParsedPage) -> set[ExtractedContact]:
+        numbers = {link[4:] for link in page.links if link[:4].lower() == "tel:"}
+        text = page.text
+        for match in _PHONE.finditer(text):
+            raw = match.group(1)
+            prefix = text[max(match.start() - _PHONE_KEYWORD_WINDOW, 0) : match.start()]
+            if raw.startswith("+") or _PHONE_KEYWORD.search(prefix):
+                numbers.add(raw)
+        return {
+            ExtractedContact(PHONE, number) for number in map(normalize_phone, numbers) if number is not None
+        }
+
+
+@register_extractor
+class SocialExtractor:
+    """Profile links on known social platforms, canonicalized; the label is the platform."""
+
+    kind = SOCIAL
+
+    def extract_contacts(self, page: ParsedPage) -> set[ExtractedContact]:
+        contacts: set[ExtractedContact] = set()
+        for link in page.links:
+            for platform, (host, pattern) in SOCIAL_PROFILES.items():
+                match = pattern.search(link)
+                if match:
+                    contacts.add(ExtractedContact(SOCIAL, f"https://{host}/{match.group(1).rstrip('/')}", platform))
+                    break
+        return contacts
+
+
+@register_extractor
+class NameExtractor:
+    """People named in structured data: ``<meta name="author">`` and JSON-LD ``Person`` nodes."""
+
+    kind = NAME
+
+    def extract_contacts(self, page: ParsedPage) -> set[ExtractedContact]:
+        contacts = {ExtractedContact(NAME, name) for name in map(_clean_name, page.meta_authors) if name}
+        for data in page.json_ld:
+            for node in _walk_json(data):
+                types = node.get("@type")
+                if "Person" not in (types if isinstance(types, list) else [types]):
+                    continue
+                name = _clean_name(node.get("name"))
+                if name:
+                    title = node.get("jobTitle")
+                    label = (_clean_name(title) or "")[:64] or None
+                    contacts.add(ExtractedContact(NAME, name, label))
+        return contacts
+
+
+def _clean_name(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    name = _WHITESPACE.sub(" ", value).strip()
+    return name if 0 < len(name) <= MAX_NAME_LENGTH and "@" not in name else None
+
+
+def _walk_json(data: object) -> Iterable[dict]:
+    if isinstance(data, dict):
+        yield data
+        for value in data.values():
+            yield from _walk_json(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _walk_json(item)
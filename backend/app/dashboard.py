@@ -2,28 +2,45 @@
 from __future__ import annotations
 from uuid import UUID
 
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, Response, status
+from sqlalchemy import ColumnElement, delete, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from . import campaigns, etags, mailer, stats
+from .admission import scrape_limiter
 from .auth import fastapi_users
-from .database import get_async_session
-from .models import EmailRecord, EmailScrapeTarget, EmailTemplate, SearchScrapeQuery, User
+from .database import Base, dialect_insert, get_async_session
+from .leases import new_node_id
+from .models import Campaign, Contact, EmailRecord, EmailScrapeTarget, EmailTemplate, SearchScrapeQuery, User
+from .replicas import ReadSessions, get_read_session, get_read_sessions
+from .responses import rows_response
 from .schemas import (
+    BulkDeleteFilter,
+    BulkItemResult,
+    BulkResult,
+    CampaignCreate,
+    CampaignRead,
+    ContactListItem,
+    ContactRead,
+    DashboardSummary,
+    EmailRecordBulkCreate,
     EmailRecordCreate,
     EmailRecordRead,
+    EmailScrapeTargetBulkCreate,
     EmailScrapeTargetCreate,
     EmailScrapeTargetRead,
     EmailTemplateRead,
     EmailTemplateUpdate,
+    SearchScrapeQueryBulkCreate,
     SearchScrapeQueryCreate,
     SearchScrapeQueryRead,
 )
-from .scraping import scrape_email_targets, scrape_search_queries, send_email_campaign
+from .scraping import scrape_email_targets, scrape_search_queries
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
@@ -41,6 +58,88 @@ def _normalize_email(email: str) -> str:
     return email.strip().lower()
 
 
+def _normalize_query(query: str) -> str:
+    return query.strip()
+
+
+async def _insert_missing(
+    session: AsyncSession, model: type[Base], column: str, values: list[str], **extra: object
+) -> dict[str, uuid.UUID]:
+    """Insert every value not already present in one statement; returns value -> id of new rows."""
+
+    if not values:
+        return {}
+    now = datetime.now(timezone.utc)
+    stmt = dialect_insert(session, model).values(
+        [{"id": uuid.uuid4(), column: value, "created_at": now, **extra} for value in values]
+    )
+    stmt = stmt.on_conflict_do_nothing(index_elements=[getattr(model, column)]).returning(
+        model.id, getattr(model, column)
+    )
+    return {value: row_id for row_id, value in await session.execute(stmt)}
+
+
+async def _ids_for(session: AsyncSession, model: type[Base], column: str, values: list[str]) -> dict[str, uuid.UUID]:
+    if not values:
+        return {}
+    result = await session.execute(select(model.id, getattr(model, column)).where(getattr(model, column).in_(values)))
+    return {value: row_id for row_id, value in result}
+
+
+def _bulk_create_result(
+    raw_values: Iterable[str],
+    normalize: Callable[[str], str | None],
+    created: dict[str, uuid.UUID],
+    existing: dict[str, uuid.UUID],
+    requeued: dict[str, uuid.UUID] | None = None,
+) -> BulkResult:
+    """Map set-based outcomes back onto the request items, in request order."""
+
+    requeued = requeued or {}
+    seen: set[str] = set()
+    results: list[BulkItemResult] = []
+    for raw in raw_values:
+        value = normalize(raw)
+        if not value:
+            results.append(BulkItemResult(value=raw, status="invalid"))
+        elif value in seen or value in existing:
+            results.append(BulkItemResult(value=value, status="duplicate", id=created.get(value) or requeued.get(value) or existing.get(value)))
+        elif value in requeued:
+            results.append(BulkItemResult(value=value, status="requeued", id=requeued[value]))
+        else:
+            results.append(BulkItemResult(value=value, status="created", id=created.get(value)))
+        if value:
+            seen.add(value)
+    succeeded = sum(1 for item in results if item.status in ("created", "requeued"))
+    return BulkResult(processed=len(results), succeeded=succeeded, results=results)
+
+
+def _delete_clauses(model: type[Base], text_column: ColumnElement[str], payload: BulkDeleteFilter) -> list[ColumnElement[bool]]:
+    clauses: list[ColumnElement[bool]] = []
+    if payload.ids is not None:
+        clauses.append(model.id.in_(payload.ids))
+    if payload.contains:
+        clauses.append(func.lower(text_column).contains(payload.contains.lower(), autoescape=True))
+    if payload.created_before is not None:
+        clauses.append(model.created_at < payload.created_before)
+    if not clauses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Provide ids, contains or created_before to select rows."
+        )
+    return clauses
+
+
+def _bulk_delete_result(payload: BulkDeleteFilter, deleted: list[tuple[uuid.UUID, str]]) -> BulkResult:
+    results = [BulkItemResult(value=value, status="deleted", id=row_id) for row_id, value in deleted]
+    deleted_ids = {row_id for row_id, _ in deleted}
+    results += [
+        BulkItemResult(value=str(row_id), status="not_found", id=row_id)
+        for row_id in dict.fromkeys(payload.ids or [])
+        if row_id not in deleted_ids
+    ]
+    return BulkResult(processed=len(results), succeeded=len(deleted), results=results)
+
+
 async def _ensure_template(session: AsyncSession) -> EmailTemplate:
     result = await session.execute(select(EmailTemplate))
     template = result.scalars().first()
@@ -51,6 +150,7 @@ async def _ensure_template(session: AsyncSession) -> EmailTemplate:
         body="Hi there,\n\nWe would love to partner with you. Let us know if you're interested!\n",
     )
     session.add(template)
+    await etags.bump_versions(session, etags.EMAIL_TEMPLATE)
     await session.commit()
     await session.refresh(template)
     return template
@@ -58,11 +158,20 @@ async def _ensure_template(session: AsyncSession) -> EmailTemplate:
 
 @router.get("/websites", response_model=list[EmailScrapeTargetRead])
 async def list_websites(
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    sessions: ReadSessions = Depends(get_read_sessions),
     _: User = Depends(current_verified_user),
-) -> list[EmailScrapeTarget]:
-    result = await session.execute(select(EmailScrapeTarget).order_by(EmailScrapeTarget.created_at.desc()))
-    return list(result.scalars().all())
+) -> Response:
+    etag, session = await etags.versioned_read(sessions, etags.WEBSITES)
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+
+    result = await session.execute(
+        select(EmailScrapeTarget.id, EmailScrapeTarget.url, EmailScrapeTarget.created_at)
+        .where(EmailScrapeTarget.scraped_at.is_(None))
+        .order_by(EmailScrapeTarget.created_at.desc())
+    )
+    return etags.with_etag(rows_response(result), etag)
 
 
 @router.post("/websites", response_model=EmailScrapeTargetRead, status_code=status.HTTP_201_CREATED)
@@ -73,12 +182,21 @@ async def add_website(
 ) -> EmailScrapeTarget:
     normalized = _normalize_url(payload.url)
     existing = await session.execute(select(EmailScrapeTarget).where(EmailScrapeTarget.url == normalized))
-    if existing.scalars().first():
+    target = existing.scalars().first()
+    if target and target.scraped_at is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Website already tracked.")
 
-    target = EmailScrapeTarget(url=normalized)
+    if target:
+        # Previously scraped: queue it again.
+        target.scraped_at = None
+        target.lease_owner = None
+        target.lease_expires_at = None
+    else:
+        target = EmailScrapeTarget(url=normalized)
     session.add(target)
     try:
+        await stats.bump(session, {stats.WEBSITES: 1}, growth={stats.WEBSITES: 1})
+        await etags.bump_versions(session, etags.WEBSITES)
         await session.commit()
     except IntegrityError as exc:  # pragma: no cover - informative error
         await session.rollback()
@@ -87,6 +205,58 @@ async def add_website(
     return target
 
 
+@router.post("/websites/bulk", response_model=BulkResult)
+async def bulk_add_websites(
+    payload: EmailScrapeTargetBulkCreate,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    """Track many websites at once; already scraped ones are queued again."""
+
+    values = list(dict.fromkeys(filter(None, map(_normalize_url, payload.urls))))
+    created = await _insert_missing(session, EmailScrapeTarget, "url", values)
+    remaining = [value for value in values if value not in created]
+    requeued: dict[str, uuid.UUID] = {}
+    if remaining:
+        result = await session.execute(
+            update(EmailScrapeTarget)
+            .where(EmailScrapeTarget.url.in_(remaining), EmailScrapeTarget.scraped_at.is_not(None))
+            .values(scraped_at=None, lease_owner=None, lease_expires_at=None)
+            .returning(EmailScrapeTarget.id, EmailScrapeTarget.url)
+            .execution_options(synchronize_session=False)
+        )
+        requeued = {value: row_id for row_id, value in result}
+    existing = await _ids_for(session, EmailScrapeTarget, "url", [value for value in remaining if value not in requeued])
+
+    added = len(created) + len(requeued)
+    await stats.bump(session, {stats.WEBSITES: added}, growth={stats.WEBSITES: len(created)})
+    if added:
+        await etags.bump_versions(session, etags.WEBSITES)
+    await session.commit()
+    return _bulk_create_result(payload.urls, _normalize_url, created, existing, requeued)
+
+
+@router.post("/websites/bulk-delete", response_model=BulkResult)
+async def bulk_delete_websites(
+    payload: BulkDeleteFilter,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    result = await session.execute(
+        delete(EmailScrapeTarget)
+        .where(*_delete_clauses(EmailScrapeTarget, EmailScrapeTarget.url, payload))
+        .returning(EmailScrapeTarget.id, EmailScrapeTarget.url, EmailScrapeTarget.scraped_at)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    pending = sum(1 for row in rows if row.scraped_at is None)
+    await stats.bump(session, {stats.WEBSITES: -pending})
+    if rows:
+        await etags.bump_versions(session, etags.WEBSITES)
+    await session.commit()
+    return _bulk_delete_result(payload, [(row.id, row.url) for row in rows])
+
+
 @router.delete("/websites/{target_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_website(
     target_id: UUID,
@@ -97,25 +267,90 @@ async def delete_website(
     if not target:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Website not found")
     await session.delete(target)
+    if target.scraped_at is None:
+        await stats.bump(session, {stats.WEBSITES: -1})
+    await etags.bump_versions(session, etags.WEBSITES)
     await session.commit()
 
 
+@router.get("/websites/{target_id}/contacts", response_model=list[ContactRead])
+async def list_website_contacts(
+    target_id: UUID,
+    kind: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(current_verified_user),
+) -> Response:
+    if await session.get(EmailScrapeTarget, target_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Website not found")
+    stmt = (
+        select(Contact.id, Contact.kind, Contact.value, Contact.label, Contact.created_at)
+        .where(Contact.target_id == target_id)
+        .order_by(Contact.kind, Contact.value)
+    )
+    if kind is not None:
+        stmt = stmt.where(Contact.kind == kind)
+    return rows_response(await session.execute(stmt))
+
+
+@router.get("/contacts", response_model=list[ContactListItem])
+async def list_contacts(
+    kind: str | None = None,
+    contains: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(current_verified_user),
+) -> Response:
+    """Contacts found across all scraped websites, newest first, with their source URL."""
+
+    stmt = (
+        select(
+            Contact.id,
+            Contact.kind,
+            Contact.value,
+            Contact.label,
+            Contact.created_at,
+            Contact.target_id,
+            EmailScrapeTarget.url,
+        )
+        .join(EmailScrapeTarget, EmailScrapeTarget.id == Contact.target_id)
+        .order_by(Contact.created_at.desc(), Contact.id)
+        .limit(min(max(limit, 1), 1000))
+        .offset(max(offset, 0))
+    )
+    if kind is not None:
+        stmt = stmt.where(Contact.kind == kind)
+    if contains:
+        stmt = stmt.where(func.lower(Contact.value).contains(contains.lower(), autoescape=True))
+    return rows_response(await session.execute(stmt))
+
+
 @router.post("/websites/scrape")
 async def trigger_email_scrape(
     session: AsyncSession = Depends(get_async_session),
-    _: User = Depends(current_verified_user),
+    user: User = Depends(current_verified_user),
 ) -> dict[str, str]:
-    message = await scrape_email_targets(session)
+    async with scrape_limiter.slot(str(user.id)):
+        message = await scrape_email_targets(session)
     return {"status": "pending", "message": message}
 
 
 @router.get("/queries", response_model=list[SearchScrapeQueryRead])
 async def list_queries(
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    sessions: ReadSessions = Depends(get_read_sessions),
     _: User = Depends(current_verified_user),
-) -> list[SearchScrapeQuery]:
-    result = await session.execute(select(SearchScrapeQuery).order_by(SearchScrapeQuery.created_at.desc()))
-    return list(result.scalars().all())
+) -> Response:
+    etag, session = await etags.versioned_read(sessions, etags.QUERIES)
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+
+    result = await session.execute(
+        select(SearchScrapeQuery.id, SearchScrapeQuery.query, SearchScrapeQuery.created_at).order_by(
+            SearchScrapeQuery.created_at.desc()
+        )
+    )
+    return etags.with_etag(rows_response(result), etag)
 
 
 @router.post("/queries", response_model=SearchScrapeQueryRead, status_code=status.HTTP_201_CREATED)
@@ -127,6 +362,8 @@ async def add_query(
     query = SearchScrapeQuery(query=payload.query.strip())
     session.add(query)
     try:
+        await stats.bump(session, {stats.QUERIES: 1}, growth={stats.QUERIES: 1})
+        await etags.bump_versions(session, etags.QUERIES)
         await session.commit()
     except IntegrityError as exc:  # pragma: no cover - informative error
         await session.rollback()
@@ -135,6 +372,43 @@ async def add_query(
     return query
 
 
+@router.post("/queries/bulk", response_model=BulkResult)
+async def bulk_add_queries(
+    payload: SearchScrapeQueryBulkCreate,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    values = list(dict.fromkeys(filter(None, map(_normalize_query, payload.queries))))
+    created = await _insert_missing(session, SearchScrapeQuery, "query", values)
+    existing = await _ids_for(session, SearchScrapeQuery, "query", [value for value in values if value not in created])
+
+    await stats.bump(session, {stats.QUERIES: len(created)}, growth={stats.QUERIES: len(created)})
+    if created:
+        await etags.bump_versions(session, etags.QUERIES)
+    await session.commit()
+    return _bulk_create_result(payload.queries, _normalize_query, created, existing)
+
+
+@router.post("/queries/bulk-delete", response_model=BulkResult)
+async def bulk_delete_queries(
+    payload: BulkDeleteFilter,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    result = await session.execute(
+        delete(SearchScrapeQuery)
+        .where(*_delete_clauses(SearchScrapeQuery, SearchScrapeQuery.query, payload))
+        .returning(SearchScrapeQuery.id, SearchScrapeQuery.query)
+        .execution_options(synchronize_session=False)
+    )
+    rows = [tuple(row) for row in result]
+    await stats.bump(session, {stats.QUERIES: -len(rows)})
+    if rows:
+        await etags.bump_versions(session, etags.QUERIES)
+    await session.commit()
+    return _bulk_delete_result(payload, rows)
+
+
 @router.delete("/queries/{query_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_query(
     query_id: UUID,
@@ -145,24 +419,35 @@ async def delete_query(
     if not query:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Query not found")
     await session.delete(query)
+    await stats.bump(session, {stats.QUERIES: -1})
+    await etags.bump_versions(session, etags.QUERIES)
     await session.commit()
 
 
 @router.post("/queries/scrape")
 async def trigger_search_scrape(
     session: AsyncSession = Depends(get_async_session),
-    _: User = Depends(current_verified_user),
+    user: User = Depends(current_verified_user),
 ) -> dict[str, str]:
-    message = await scrape_search_queries(session)
+    async with scrape_limiter.slot(str(user.id)):
+        message = await scrape_search_queries(session)
     return {"status": "pending", "message": message}
 
 
 @router.get("/email-template", response_model=EmailTemplateRead)
 async def get_email_template(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     _: User = Depends(current_verified_user),
-) -> EmailTemplate:
+) -> EmailTemplate | Response:
+    etag = await etags.current_etag(session, etags.EMAIL_TEMPLATE)
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+
     template = await _ensure_template(session)
+    # Re-read in case _ensure_template just created (and versioned) the template.
+    etags.with_etag(response, await etags.current_etag(session, etags.EMAIL_TEMPLATE))
     return template
 
 
@@ -176,6 +461,7 @@ async def update_email_template(
     template.subject = payload.subject
     template.body = payload.body
     session.add(template)
+    await etags.bump_versions(session, etags.EMAIL_TEMPLATE)
     await session.commit()
     await session.refresh(template)
     return template
@@ -183,31 +469,97 @@ async def update_email_template(
 
 @router.post("/email/send")
 async def trigger_email_send(
+    background_tasks: BackgroundTasks,
+    payload: CampaignCreate | None = None,
+    idempotency_key: str | None = Header(default=None, max_length=64),
     session: AsyncSession = Depends(get_async_session),
     _: User = Depends(current_verified_user),
 ) -> dict[str, str]:
+    """Queue a campaign in the outbox; delivery happens in the background or on campaign workers.
+
+    Retries are safe: a request with a known ``Idempotency-Key``, or for the same
+    template and recipients as a campaign that is still sending, returns that
+    campaign instead of emailing everyone again.
+    """
+
     template = await _ensure_template(session)
-    result = await session.execute(select(EmailRecord))
-    records = list(result.scalars().all())
-    emails = [record.email for record in records]
-    message = await send_email_campaign(session, template, emails)
-
-    if records:
-        timestamp = datetime.now(timezone.utc)
-        for record in records:
-            record.last_sent_at = timestamp
-            record.send_count = (record.send_count or 0) + 1
-            session.add(record)
-        await session.commit()
+    campaign, created = await campaigns.enqueue_campaign(session, template, payload, idempotency_key)
+    message = f"Queued {campaign.total_recipients} recipients."
+    if not created:
+        state = "completed" if campaign.completed_at is not None else "queued"
+        return {
+            "status": state,
+            "campaign_id": str(campaign.id),
+            "message": "An identical campaign was already queued; nothing was sent twice.",
+        }
+    if not campaign.total_recipients:
+        message = "No recipients match this campaign."
+    elif mailer.is_configured():
+        background_tasks.add_task(campaigns.drain_outbox_in_background, new_node_id())
+    else:
+        message += " Configure SMTP and run `python -m app.campaign_worker` to deliver them."
+
+    return {"status": "queued", "campaign_id": str(campaign.id), "message": message}
+
+
+@router.get("/campaigns", response_model=list[CampaignRead])
+async def list_campaigns(
+    limit: int = 20,
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(current_verified_user),
+) -> list[CampaignRead]:
+    """Most recent campaigns with per-status delivery counts."""
+
+    result = await session.execute(select(Campaign).order_by(Campaign.created_at.desc()).limit(min(max(limit, 1), 100)))
+    rows = list(result.scalars().all())
+    progress = await campaigns.campaign_progress(session, [campaign.id for campaign in rows])
+    return [
+        CampaignRead(
+            id=campaign.id,
+            subject=campaign.subject,
+            total_recipients=campaign.total_recipients,
+            created_at=campaign.created_at,
+            completed_at=campaign.completed_at,
+            **progress[campaign.id],
+        )
+        for campaign in rows
+    ]
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def dashboard_summary(
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> DashboardSummary:
+    """Return counts, last-run timestamps and growth without listing whole tables.
+
+    Read on the primary: the result is cached per process, and a lagging
+    replica would keep serving stale counts as fresh for the whole TTL.
+    """
+
+    return await stats.get_summary(session)
+
 
-    return {"status": "pending", "message": message}
 @router.get("/emails", response_model=list[EmailRecordRead])
 async def list_emails(
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    sessions: ReadSessions = Depends(get_read_sessions),
     _: User = Depends(current_verified_user),
-) -> list[EmailRecord]:
-    result = await session.execute(select(EmailRecord).order_by(EmailRecord.created_at.desc()))
-    return list(result.scalars().all())
+) -> Response:
+    etag, session = await etags.versioned_read(sessions, etags.EMAILS)
+    if etags.etag_matches(request, etag):
+        return etags.not_modified(etag)
+
+    result = await session.execute(
+        select(
+            EmailRecord.id,
+            EmailRecord.email,
+            EmailRecord.created_at,
+            EmailRecord.last_sent_at,
+            EmailRecord.send_count,
+        ).order_by(EmailRecord.created_at.desc())
+    )
+    return etags.with_etag(rows_response(result), etag)
 
 
 @router.post("/emails", response_model=EmailRecordRead, status_code=status.HTTP_201_CREATED)
@@ -224,6 +576,8 @@ async def add_email(
     record = EmailRecord(email=normalized)
     session.add(record)
     try:
+        await stats.bump(session, {stats.EMAILS: 1}, growth={stats.EMAILS: 1})
+        await etags.bump_versions(session, etags.EMAILS)
         await session.commit()
     except IntegrityError as exc:  # pragma: no cover
         await session.rollback()
@@ -232,6 +586,48 @@ async def add_email(
     return record
 
 
+@router.post("/emails/bulk", response_model=BulkResult)
+async def bulk_add_emails(
+    payload: EmailRecordBulkCreate,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    def normalize(email: str) -> str | None:
+        normalized = _normalize_email(email)
+        return normalized if "@" in normalized else None
+
+    values = list(dict.fromkeys(filter(None, map(normalize, payload.emails))))
+    created = await _insert_missing(session, EmailRecord, "email", values, send_count=0)
+    existing = await _ids_for(session, EmailRecord, "email", [value for value in values if value not in created])
+
+    await stats.bump(session, {stats.EMAILS: len(created)}, growth={stats.EMAILS: len(created)})
+    if created:
+        await etags.bump_versions(session, etags.EMAILS)
+    await session.commit()
+    return _bulk_create_result(payload.emails, normalize, created, existing)
+
+
+@router.post("/emails/bulk-delete", response_model=BulkResult)
+async def bulk_delete_emails(
+    payload: BulkDeleteFilter,
+    session: AsyncSession = Depends(get_async_session),
+    _: User = Depends(current_verified_user),
+) -> BulkResult:
+    result = await session.execute(
+        delete(EmailRecord)
+        .where(*_delete_clauses(EmailRecord, EmailRecord.email, payload))
+        .returning(EmailRecord.id, EmailRecord.email, EmailRecord.send_count)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    sent = sum(1 for row in rows if row.send_count)
+    await stats.bump(session, {stats.EMAILS: -len(rows), stats.EMAILS_SENT: -sent})
+    if rows:
+        await etags.bump_versions(session, etags.EMAILS)
+    await session.commit()
+    return _bulk_delete_result(payload, [(row.id, row.email) for row in rows])
+
+
 @router.delete("/emails/{email_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_email(
     email_id: UUID,
@@ -242,4 +638,6 @@ async def delete_email(
     if not record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Email not found")
     await session.delete(record)
+    await stats.bump(session, {stats.EMAILS: -1, stats.EMAILS_SENT: -1 if record.send_count else 0})
+    await etags.bump_versions(session, etags.EMAILS)
     await session.commit()
@@ -1,6 +1,8 @@
 """Async database session and declarative base configuration."""
 from collections.abc import AsyncIterator
 
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -23,8 +25,38 @@ engine = create_async_engine(
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+# SQLite ignores ON DELETE CASCADE / SET NULL unless asked per connection.
+# Alembic builds its own engine without this, so batch migrations can still
+# rebuild tables without cascading deletes into their children.
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
+# Optional read replicas; routing lives in app.replicas.
+replica_engines = [
+    create_async_engine(url, future=True, connect_args=settings.sqlalchemy_connect_args(url))
+    for url in settings.replica_urls
+]
+for _replica in replica_engines:
+    if _replica.dialect.name == "sqlite":
+        event.listen(_replica.sync_engine, "connect", _enable_sqlite_foreign_keys)
+
+
 async def get_async_session() -> AsyncIterator[AsyncSession]:
     """FastAPI dependency that provides an AsyncSession per request."""
 
     async with async_session_maker() as session:
         yield session
+
+
+def dialect_insert(session: AsyncSession, model: type[Base]):
+    """Return an INSERT construct with ``ON CONFLICT`` support for the session's dialect."""
+
+    if session.bind.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
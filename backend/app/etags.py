@@ -0,0 +1,95 @@
+"""Per-resource change counters and strong ETags for dashboard reads."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fastapi import Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import dialect_insert
+from .models import ResourceVersion
+
+if TYPE_CHECKING:
+    from .replicas import ReadSessions
+
+WEBSITES = "websites"
+QUERIES = "queries"
+EMAILS = "emails"
+EMAIL_TEMPLATE = "email_template"
+
+# Suffixes appended by CompressionMiddleware to keep per-encoding ETags distinct.
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+async def bump_versions(session: AsyncSession, *resources: str) -> None:
+    """Increment the change counter of each resource inside the caller's transaction."""
+
+    for resource in resources:
+        stmt = dialect_insert(session, ResourceVersion).values(resource=resource, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResourceVersion.resource],
+            set_={"version": ResourceVersion.version + 1},
+        )
+        await session.execute(stmt)
+
+
+async def current_version(session: AsyncSession, resource: str) -> int:
+    result = await session.execute(select(ResourceVersion.version).where(ResourceVersion.resource == resource))
+    return result.scalar_one_or_none() or 0
+
+
+def _etag(resource: str, version: int) -> str:
+    return f'"{resource}-{version}"'
+
+
+async def current_etag(session: AsyncSession, resource: str) -> str:
+    """Build the strong ETag for the current version of ``resource``."""
+
+    return _etag(resource, await current_version(session, resource))
+
+
+async def versioned_read(sessions: ReadSessions, resource: str) -> tuple[str, AsyncSession]:
+    """ETag from the primary's version of ``resource`` and the session to read the body from.
+
+    The replica is used only if it has already replayed that version; a
+    lagging replica would otherwise pair stale rows with a fresh ETag (or
+    hand out an older ETag than the client already has).
+    """
+
+    version = await current_version(sessions.primary, resource)
+    session = sessions.primary
+    if sessions.replica is not None and await current_version(sessions.replica, resource) >= version:
+        session = sessions.replica
+    return _etag(resource, version), session
+
+
+def _strip_encoding(tag: str) -> str:
+    tag = tag.strip()
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return f'{tag[: -len(suffix) - 1]}"'
+    return tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True when the request's If-None-Match covers ``etag``."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(_strip_encoding(tag.strip().removeprefix("W/")) == etag for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Attach validators so browsers revalidate instead of refetching full bodies."""
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,17 @@
+"""Helpers shared by the lease-based workers (scraper nodes and campaign senders)."""
+from __future__ import annotations
+
+import os
+import socket
+import uuid
+from datetime import datetime, timezone
+
+
+def new_node_id() -> str:
+    """Identify this worker process in lease columns."""
+
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
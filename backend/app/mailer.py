@@ -0,0 +1,103 @@
+"""SMTP delivery for campaign batches."""
+from __future__ import annotations
+
+import smtplib
+import ssl
+from dataclasses import dataclass
+from email.message import EmailMessage
+
+from .config import get_settings
+
+settings = get_settings()
+
+SENT = "sent"
+BOUNCED = "bounced"
+RETRY = "retry"
+
+
+@dataclass(frozen=True)
+class Outgoing:
+    recipient: str
+    message_id: str
+
+
+@dataclass(frozen=True)
+class Outcome:
+    status: str
+    error: str | None = None
+
+
+def is_configured() -> bool:
+    return bool(settings.smtp_host and (settings.smtp_from or settings.smtp_username))
+
+
+def _classify(code: int, error: object) -> Outcome:
+    # A 5xx reply to RCPT TO is permanent for that recipient (unknown mailbox,
+    # rejected domain...); anything else is worth another attempt.
+    return Outcome(BOUNCED if code >= 500 else RETRY, f"{code} {error!s}"[:1000])
+
+
+def _retry(code: int, error: object) -> Outcome:
+    return Outcome(RETRY, f"{code} {error!s}"[:1000])
+
+
+class Connection:
+    """One SMTP session used for a run of messages, one :meth:`send` at a time.
+
+    Nothing here raises: every message gets an :class:`Outcome`. Only a
+    refused recipient counts as a bounce. Message-level rejections (``DATA``
+    errors, policy replies) are retried, and a refused sender or a connection
+    failure breaks the session so this and every later message is marked for
+    retry, so a misconfigured ``SMTP_FROM`` never bounces a whole campaign.
+    """
+
+    def __init__(self) -> None:
+        self.sender = settings.smtp_from or settings.smtp_username
+        self._smtp: smtplib.SMTP | None = None
+        # Set once the session is unusable; later messages are retried with it.
+        self.error: str | None = None
+
+    def _fail(self, exc: Exception) -> Outcome:
+        self.error = str(exc)[:1000]
+        self.close()
+        return Outcome(RETRY, self.error)
+
+    def open(self) -> None:
+        try:
+            self._smtp = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
+            if settings.smtp_starttls:
+                self._smtp.starttls(context=ssl.create_default_context())
+            if settings.smtp_username:
+                self._smtp.login(settings.smtp_username, settings.smtp_password or "")
+        except (OSError, smtplib.SMTPException) as exc:
+            self._fail(exc)
+
+    def send(self, subject: str, body: str, outgoing: Outgoing) -> Outcome:
+        if self._smtp is None:
+            return Outcome(RETRY, self.error)
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = outgoing.recipient
+        message["Subject"] = subject
+        message["Message-ID"] = outgoing.message_id
+        message.set_content(body)
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as exc:
+            code, error = next(iter(exc.recipients.values()))
+            return _classify(code, error)
+        except smtplib.SMTPSenderRefused as exc:
+            return self._fail(exc)
+        except smtplib.SMTPResponseException as exc:
+            return _retry(exc.smtp_code, exc.smtp_error)
+        except (OSError, smtplib.SMTPException) as exc:
+            return self._fail(exc)
+        return Outcome(SENT)
+
+    def close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                smtp.close()
@@ -1,36 +1,27 @@
 """Entry point for the FastAPI application."""
 
-from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 
 from .admin import router as admin_router
 from .auth import auth_backend, fastapi_users
+from .compression import CompressionMiddleware
 from .dashboard import router as dashboard_router
 from .config import get_settings
-from .database import Base, engine
 from .models import User
+from .replicas import ReadYourWritesMiddleware
 from .scrape_actions import router as scrape_actions_router
 from .schemas import UserCreate, UserRead, UserUpdate
+from .static_files import FrontendStaticFiles
 
 settings = get_settings()
 
-async def on_startup() -> None:
-    """Create the database schema on app startup."""
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-@asynccontextmanager
-async def lifespan_(app: FastAPI):
-    await on_startup()
-    yield
-
-app = FastAPI(title=settings.app_name, lifespan=lifespan_)
+# The schema is managed by Alembic migrations (see backend/migrations) which
+# run out of band, so booting a worker never touches DDL.
+app = FastAPI(title=settings.app_name)
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,6 +30,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+app.add_middleware(ReadYourWritesMiddleware)
 current_active_user = fastapi_users.current_user(active=True)
 
 app.include_router(
@@ -77,7 +70,11 @@ def mount_frontend(app: FastAPI) -> None:
     backend_dir = Path(__file__).resolve().parent.parent
     dist_dir = (backend_dir.parent / settings.front_end_dist).resolve()
     if dist_dir.exists():
-        app.mount("/", StaticFiles(directory=dist_dir, html=True), name="frontend")
+        app.mount(
+            "/",
+            FrontendStaticFiles(directory=dist_dir),
+            name="frontend",
+        )
     else:
 
         @app.get("/")
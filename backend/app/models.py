@@ -1,9 +1,9 @@
 """Database models used across the application."""
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 import uuid
 
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -16,13 +16,22 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 
 
 class EmailScrapeTarget(Base):
-    """Website to scan for potential contacts."""
+    """Website to scan for potential contacts.
+
+    Scraper nodes claim pending targets by setting ``lease_owner`` and
+    ``lease_expires_at``; a finished target keeps its row with ``scraped_at``
+    set so a late or repeated completion is a no-op.
+    """
 
     __tablename__ = "email_scrape_targets"
+    __table_args__ = (Index("ix_email_scrape_targets_pending", "scraped_at", "lease_expires_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     url: Mapped[str] = mapped_column(String(length=512), unique=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    lease_owner: Mapped[str | None] = mapped_column(String(length=128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    scraped_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class SearchScrapeQuery(Base):
@@ -60,3 +69,118 @@ class EmailTemplate(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+
+
+class DashboardStat(Base):
+    """Running aggregate kept up to date by the ingest and send paths."""
+
+    __tablename__ = "dashboard_stats"
+
+    name: Mapped[str] = mapped_column(String(length=64), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+
+class DashboardDailyStat(Base):
+    """Per-day increments used to chart growth over time."""
+
+    __tablename__ = "dashboard_daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    name: Mapped[str] = mapped_column(String(length=64), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class ResourceVersion(Base):
+    """Change counter per dashboard resource, used to answer conditional GETs."""
+
+    __tablename__ = "resource_versions"
+
+    resource: Mapped[str] = mapped_column(String(length=64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class PageFingerprint(Base):
+    """Hash of a scraped page's markup and the contacts extracted from it."""
+
+    __tablename__ = "page_fingerprints"
+
+    hash: Mapped[str] = mapped_column(String(length=32), primary_key=True)
+    site: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    emails: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    # JSON list of [kind, value, label]; NULL on rows written before contacts were stored.
+    contacts: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False, index=True
+    )
+
+
+class Contact(Base):
+    """Typed contact detail (email, phone, social profile, name) found on a scrape target."""
+
+    __tablename__ = "contacts"
+    __table_args__ = (
+        UniqueConstraint("target_id", "kind", "value", name="uq_contacts_target_kind_value"),
+        Index("ix_contacts_kind_value", "kind", "value"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    target_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("email_scrape_targets.id", ondelete="CASCADE"), nullable=False
+    )
+    kind: Mapped[str] = mapped_column(String(length=16), nullable=False)
+    value: Mapped[str] = mapped_column(String(length=512), nullable=False)
+    label: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+
+class Campaign(Base):
+    """One send of the outreach template; the template is copied at enqueue time."""
+
+    __tablename__ = "campaigns"
+    __table_args__ = (
+        UniqueConstraint("idempotency_key", name="uq_campaigns_idempotency_key"),
+        Index("ix_campaigns_content_key", "content_key"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    subject: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    total_recipients: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Client-supplied Idempotency-Key, and a hash of subject, body and recipient
+    # filter used to refuse a second identical campaign while one is in flight.
+    idempotency_key: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
+    content_key: Mapped[str | None] = mapped_column(String(length=32), nullable=True)
+
+
+class CampaignDelivery(Base):
+    """Outbox row: delivery state of a campaign for one recipient.
+
+    Rows move ``queued`` -> ``sending`` (leased to a sender node) -> ``sent``,
+    ``bounced`` or ``failed``; a ``sending`` row whose lease expired is picked
+    up again. The sequential id keeps ``(status, id)`` scans in enqueue order.
+    """
+
+    __tablename__ = "campaign_deliveries"
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "email", name="uq_campaign_deliveries_campaign_email"),
+        Index("ix_campaign_deliveries_status", "status", "id"),
+        Index("ix_campaign_deliveries_campaign_status", "campaign_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    campaign_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
+    email_record_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("email_records.id", ondelete="SET NULL"), nullable=True
+    )
+    email: Mapped[str] = mapped_column(String(length=320), nullable=False)
+    status: Mapped[str] = mapped_column(String(length=16), default="queued", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    lease_owner: Mapped[str | None] = mapped_column(String(length=128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -0,0 +1,161 @@
+"""Page fingerprints used to skip re-extracting pages that were already seen.
+
+A page is fingerprinted by a hash of its raw bytes, so a hit means the exact
+same markup was extracted before (the same page reached through another URL,
+or unchanged since the last scrape) and its stored contacts can be reused
+as-is. Hashing the raw page costs a fraction of a millisecond, far less than
+parsing it; matching near-identical pages instead would need a normalized
+text, a SimHash and a key over every contact-bearing token, which together
+cost more than running the extractors they would skip.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .contact_extractors import EMAIL, ExtractedContact
+from .database import dialect_insert
+from .models import PageFingerprint
+
+
+def exact_hash(page_source: str) -> str:
+    return hashlib.blake2b(page_source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def site_of(url: str) -> str:
+    return urlsplit(url).netloc.lower().removeprefix("www.")
+
+
+@dataclass
+class _Entry:
+    site: str
+    contacts: frozenset[ExtractedContact]
+
+
+class FingerprintStore:
+    """Bounded LRU of page hashes and the contacts extracted from them.
+
+    Shared by every extractor in a scrape run (and preloaded from the
+    ``page_fingerprints`` table for cross-run hits). New or re-seen entries
+    are tracked so they can be persisted after the batch.
+    """
+
+    def __init__(self, max_entries: int = 50_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, page_source: str) -> tuple[str, frozenset[ExtractedContact] | None]:
+        """Hash a page and return the contacts stored for it (``None`` when it must be extracted)."""
+
+        key = exact_hash(page_source)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return key, None
+            self._entries.move_to_end(key)
+            self._dirty.add(key)
+            self.hits += 1
+            return key, entry.contacts
+
+    def add(self, site: str, key: str, contacts: Iterable[ExtractedContact], *, dirty: bool = True) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(site=site, contacts=frozenset(contacts))
+            self._entries.move_to_end(key)
+            if dirty:
+                self._dirty.add(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._dirty.discard(evicted)
+
+    def take_dirty(self) -> list[tuple[str, _Entry]]:
+        with self._lock:
+            dirty = [(key, self._entries[key]) for key in self._dirty if key in self._entries]
+            self._dirty.clear()
+            return dirty
+
+
+async def load_store(session: AsyncSession, max_entries: int) -> FingerprintStore:
+    """Build a store preloaded with the most recently seen persisted fingerprints."""
+
+    store = FingerprintStore(max_entries=max_entries)
+    # Rows written before contacts were stored only know the emails; leave
+    # them out so those pages are extracted again.
+    result = await session.execute(
+        select(PageFingerprint)
+        .where(PageFingerprint.contacts.is_not(None))
+        .order_by(PageFingerprint.last_seen_at.desc())
+        .limit(max_entries)
+    )
+    for row in reversed(result.scalars().all()):
+        contacts = [ExtractedContact(*contact) for contact in json.loads(row.contacts)]
+        store.add(row.site, row.hash, contacts, dirty=False)
+    return store
+
+
+async def persist_store(session: AsyncSession, store: FingerprintStore) -> None:
+    """Upsert new/re-seen fingerprints and trim the table to ``store.max_entries`` rows."""
+
+    dirty = store.take_dirty()
+    if not dirty:
+        return
+
+    now = datetime.now(timezone.utc)
+    stmt = dialect_insert(session, PageFingerprint).values(
+        [
+            {
+                "hash": key,
+                "site": entry.site[:255],
+                "emails": json.dumps(sorted(contact.value for contact in entry.contacts if contact.kind == EMAIL)),
+                "contacts": json.dumps(sorted(entry.contacts, key=lambda contact: contact[:2])),
+                "last_seen_at": now,
+            }
+            for key, entry in dirty
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PageFingerprint.hash],
+        set_={
+            "emails": stmt.excluded.emails,
+            "contacts": stmt.excluded.contacts,
+            "last_seen_at": stmt.excluded.last_seen_at,
+        },
+    )
+    await session.execute(stmt)
+
+    # First row past the limit in (last_seen_at, hash) order; the hash breaks
+    # timestamp ties so exactly ``max_entries`` rows are kept.
+    cutoff = (
+        await session.execute(
+            select(PageFingerprint.last_seen_at, PageFingerprint.hash)
+            .order_by(PageFingerprint.last_seen_at.desc(), PageFingerprint.hash.desc())
+            .offset(store.max_entries)
+            .limit(1)
+        )
+    ).first()
+    if cutoff is not None:
+        await session.execute(
+            delete(PageFingerprint).where(
+                or_(
+                    PageFingerprint.last_seen_at < cutoff.last_seen_at,
+                    and_(PageFingerprint.last_seen_at == cutoff.last_seen_at, PageFingerprint.hash <= cutoff.hash),
+                )
+            )
+        )
+    await session.commit()
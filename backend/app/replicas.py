@@ -0,0 +1,192 @@
+"""Route read-only queries to read replicas.
+
+Read-heavy routes depend on :func:`get_read_session` instead of
+``get_async_session``. Reads are spread round-robin over replicas that passed
+their last health check (``SELECT 1`` plus, optionally, a replication lag
+limit) and fall back to the primary when none is healthy. A client that just
+mutated something reads from the primary for ``read_your_writes_seconds``,
+tracked both in-process and with a cookie so other workers honour it too.
+
+Routes that send ETags depend on :func:`get_read_sessions` instead: the
+resource version is always read on the primary, and the replica only serves
+the body when it has caught up with that version (see
+:func:`app.etags.versioned_read`), so validators never go backwards.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import get_settings
+from .database import async_session_maker, replica_engines
+
+settings = get_settings()
+
+STICKY_COOKIE = "db_primary_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+MAX_STICKY_CLIENTS = 10_000
+HEALTH_CHECK_TIMEOUT = 2.0
+
+_POSTGRES_LAG = text(
+    "SELECT CASE WHEN pg_is_in_recovery() "
+    "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) ELSE 0 END"
+)
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        # Unknown until the first health check; reads go to the primary meanwhile.
+        self.healthy = False
+        event.listen(engine.sync_engine, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect:
+            self.healthy = False
+
+    async def check(self) -> None:
+        try:
+            async with asyncio.timeout(HEALTH_CHECK_TIMEOUT):
+                async with self.engine.connect() as connection:
+                    if self.engine.dialect.name == "postgresql" and settings.replica_max_lag_seconds is not None:
+                        lag = float((await connection.execute(_POSTGRES_LAG)).scalar_one())
+                        self.healthy = lag <= settings.replica_max_lag_seconds
+                    else:
+                        await connection.execute(text("SELECT 1"))
+                        self.healthy = True
+        except Exception:
+            self.healthy = False
+
+
+class ReplicaRouter:
+    """Choose the session factory for a read and remember recent writers."""
+
+    def __init__(self, engines: list[AsyncEngine]) -> None:
+        self.replicas = [Replica(engine) for engine in engines]
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._sticky: OrderedDict[str, float] = OrderedDict()
+        self._last_check = -float("inf")
+        self._checking: asyncio.Task[None] | None = None
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(replica.check() for replica in self.replicas))
+
+    def _maybe_check_health(self) -> None:
+        now = time.monotonic()
+        if now - self._last_check < settings.replica_health_interval:
+            return
+        if self._checking is None or self._checking.done():
+            self._last_check = now
+            self._checking = asyncio.create_task(self.check_health())
+
+    def mark_write(self, client_key: str) -> None:
+        self._sticky[client_key] = time.monotonic() + settings.read_your_writes_seconds
+        self._sticky.move_to_end(client_key)
+        while len(self._sticky) > MAX_STICKY_CLIENTS:
+            self._sticky.popitem(last=False)
+
+    def _is_sticky(self, headers: Headers, client_key: str | None) -> bool:
+        if client_key is not None and self._sticky.get(client_key, 0.0) > time.monotonic():
+            return True
+        try:
+            return float(_cookie(headers, STICKY_COOKIE) or 0) > time.time()
+        except ValueError:
+            return False
+
+    def session_maker_for(self, headers: Headers) -> async_sessionmaker[AsyncSession]:
+        if self._cycle is None:
+            return async_session_maker
+        self._maybe_check_health()
+        if self._is_sticky(headers, client_key(headers)):
+            return async_session_maker
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if replica.healthy:
+                return replica.session_maker
+        return async_session_maker
+
+
+def _cookie(headers: Headers, name: str) -> str | None:
+    for part in headers.get("cookie", "").split(";"):
+        key, _, value = part.strip().partition("=")
+        if key == name:
+            return value
+    return None
+
+
+def client_key(headers: Headers) -> str | None:
+    """Identify a client by its bearer token (hashed; tokens are never stored)."""
+
+    authorization = headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.blake2b(authorization.encode("utf-8"), digest_size=16).hexdigest()
+
+
+replica_router = ReplicaRouter(replica_engines)
+
+
+async def get_read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency for read-only routes: a replica session when safe, else the primary."""
+
+    async with replica_router.session_maker_for(request.headers)() as session:
+        yield session
+
+
+@dataclass
+class ReadSessions:
+    primary: AsyncSession
+    # None when this read would go to the primary anyway.
+    replica: AsyncSession | None = None
+
+
+async def get_read_sessions(request: Request) -> AsyncIterator[ReadSessions]:
+    """FastAPI dependency for versioned reads: a primary session plus a replica session when one is usable."""
+
+    session_maker = replica_router.session_maker_for(request.headers)
+    async with async_session_maker() as primary:
+        if session_maker is async_session_maker:
+            yield ReadSessions(primary)
+            return
+        async with session_maker() as replica:
+            yield ReadSessions(primary, replica)
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client to the primary for a short while after a successful mutation."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or not replica_router.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 400:
+                key = client_key(Headers(scope=scope))
+                if key is not None:
+                    replica_router.mark_write(key)
+                until = math.ceil(time.time() + settings.read_your_writes_seconds)
+                MutableHeaders(raw=message["headers"]).append(
+                    "Set-Cookie",
+                    f"{STICKY_COOKIE}={until}; Max-Age={int(settings.read_your_writes_seconds) + 1}; "
+                    "Path=/api; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
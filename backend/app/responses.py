@@ -0,0 +1,29 @@
+"""Fast JSON responses for large list endpoints."""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi import responses
+from sqlalchemy.engine import Result
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(responses.ORJSONResponse):
+    """FastAPI's ORJSONResponse, rendering UTC datetimes with a ``Z`` suffix."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def rows_response(result: Result, status_code: int = 200) -> ORJSONResponse:
+    """Serialize a column-level SELECT straight from row tuples.
+
+    Skips ORM entity loading and per-row Pydantic validation; the selected
+    column labels become the JSON keys, so select exactly the fields of the
+    route's ``response_model``.
+    """
+
+    keys = list(result.keys())
+    return ORJSONResponse([dict(zip(keys, row)) for row in result], status_code=status_code)
@@ -1,9 +1,10 @@
 """Pydantic schemas that extend fastapi-users base models."""
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 import uuid
 
 from fastapi_users import schemas as user_schemas
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserRead(user_schemas.BaseUser[uuid.UUID]):
@@ -33,6 +34,21 @@ class EmailScrapeTargetRead(EmailScrapeTargetBase):
     created_at: datetime
 
 
+class ContactRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    kind: str
+    value: str
+    label: str | None = None
+    created_at: datetime
+
+
+class ContactListItem(ContactRead):
+    target_id: uuid.UUID
+    url: str
+
+
 class SearchScrapeQueryBase(BaseModel):
     query: str
 
@@ -76,3 +92,88 @@ class EmailTemplateRead(BaseModel):
 class EmailTemplateUpdate(BaseModel):
     subject: str
     body: str
+
+
+class DashboardGrowthPoint(BaseModel):
+    day: date
+    emails: int = 0
+    websites: int = 0
+    queries: int = 0
+    messages_sent: int = 0
+
+
+class DashboardSummary(BaseModel):
+    websites: int
+    queries: int
+    emails: int
+    emails_sent: int
+    emails_never_sent: int
+    messages_sent: int
+    last_email_scrape_at: datetime | None = None
+    last_search_scrape_at: datetime | None = None
+    last_email_send_at: datetime | None = None
+    growth: list[DashboardGrowthPoint]
+
+
+BULK_MAX_ITEMS = 5000
+
+BulkItemStatus = Literal[
+    "created", "requeued", "duplicate", "invalid", "deleted", "not_found", "verified", "already_verified", "skipped"
+]
+
+
+class BulkItemResult(BaseModel):
+    value: str
+    status: BulkItemStatus
+    id: uuid.UUID | None = None
+
+
+class BulkResult(BaseModel):
+    processed: int
+    succeeded: int
+    results: list[BulkItemResult]
+
+
+class EmailScrapeTargetBulkCreate(BaseModel):
+    urls: list[str] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class SearchScrapeQueryBulkCreate(BaseModel):
+    queries: list[str] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class EmailRecordBulkCreate(BaseModel):
+    emails: list[str] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkDeleteFilter(BaseModel):
+    """Rows matching every given criterion are deleted; at least one is required."""
+
+    ids: list[uuid.UUID] | None = Field(default=None, max_length=BULK_MAX_ITEMS)
+    contains: str | None = None
+    created_before: datetime | None = None
+
+
+class UserBulkAction(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class CampaignCreate(BaseModel):
+    """Recipient filter for a campaign; an empty filter targets every stored email."""
+
+    contains: str | None = None
+    created_before: datetime | None = None
+    never_sent: bool = False
+
+
+class CampaignRead(BaseModel):
+    id: uuid.UUID
+    subject: str
+    total_recipients: int
+    created_at: datetime
+    completed_at: datetime | None
+    queued: int = 0
+    sending: int = 0
+    sent: int = 0
+    failed: int = 0
+    bounced: int = 0
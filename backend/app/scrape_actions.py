@@ -1,29 +1,42 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-from ddgs import DDGS
-from extract_emails import DefaultWorker
-from extract_emails.browsers import HttpxBrowser
-from extract_emails.link_filters import ContactInfoLinkFilter
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
 
-from .scrape_email_extractor import AdvancedEmailExtractor
+from .admission import run_scrape_job, scrape_limiter
+from .auth import fastapi_users
+from .config import get_settings
+from .models import User
 from .scrape_targets import CONTACT_PATHS
 
+if TYPE_CHECKING:
+    from .contact_extractors import ExtractedContact
+    from .page_fingerprints import FingerprintStore
+
+# ddgs, extract_emails and httpx are imported inside the actions so that
+# workers serving only auth/dashboard traffic never pay for them at boot.
+
 router = APIRouter(prefix="/api", tags=["scrape-actions"])
+settings = get_settings()
+
+current_verified_user = fastapi_users.current_user(active=True, verified=True)
+
+MAX_ACTION_ITEMS = 50
 
 
 class SearchPayload(BaseModel):
-    queries: list[str]
+    queries: list[str] = Field(max_length=MAX_ACTION_ITEMS)
 
 
 class ScrapePayload(BaseModel):
-    urls: list[str]
+    urls: list[str] = Field(max_length=MAX_ACTION_ITEMS)
 
 
 def search_action(queries: Iterable[str]) -> list[str]:
+    from ddgs import DDGS
+
     urls: list[str] = []
 
     for query in queries:
@@ -40,30 +53,50 @@ def search_action(queries: Iterable[str]) -> list[str]:
     return list(set(url.split("/")[0] + "//" + url.split("/")[2] for url in urls))
 
 
-def scrape_action(scrape_urls: Iterable[str]) -> list[str]:
+def scrape_contacts(
+    scrape_urls: Iterable[str], fingerprints: FingerprintStore | None = None
+) -> dict[str, set[ExtractedContact]]:
+    """Crawl each site's contact pages once and collect every contact kind, keyed by start URL."""
+
+    from extract_emails import DefaultWorker
+    from extract_emails.link_filters import ContactInfoLinkFilter
+
+    from .page_fingerprints import site_of
+    from .scrape_browser import StreamingHttpxBrowser
+    from .scrape_email_extractor import ContactPipeline
+
     assert CONTACT_PATHS
-    emails: list[Iterable[str]] = []
+    contacts: dict[str, set[ExtractedContact]] = {}
 
-    with HttpxBrowser() as browser:
+    with StreamingHttpxBrowser(settings.scrape_max_page_bytes, settings.scrape_fetch_timeout) as browser:
         for url in scrape_urls:
+            pipeline = ContactPipeline(fingerprints, site_of(url))
             worker = DefaultWorker(
                 url,
                 browser,
                 link_filter=ContactInfoLinkFilter(url, CONTACT_PATHS),
-                data_extractors=[AdvancedEmailExtractor()],
+                data_extractors=[pipeline],
             )
-            data = worker.get_data()
-            emails_found = [page.data["email"] for page in data if page.data["email"]]
-            emails += emails_found
+            worker.get_data()
+            contacts[url] = pipeline.contacts
+
+    return contacts
+
+
+def scrape_action(scrape_urls: Iterable[str], fingerprints: FingerprintStore | None = None) -> list[str]:
+    from .contact_extractors import EMAIL
 
-    return list({item for sub in emails for item in sub})
+    found = scrape_contacts(scrape_urls, fingerprints)
+    return list({contact.value for contacts in found.values() for contact in contacts if contact.kind == EMAIL})
 
 
 @router.post("/search-action")
-def search_action_endpoint(payload: SearchPayload) -> list[str]:
-    return search_action(payload.queries)
+async def search_action_endpoint(payload: SearchPayload, user: User = Depends(current_verified_user)) -> list[str]:
+    async with scrape_limiter.slot(str(user.id)):
+        return await run_scrape_job(search_action, payload.queries)
 
 
 @router.post("/scrape-action")
-def scrape_action_endpoint(payload: ScrapePayload) -> list[str]:
-    return scrape_action(payload.urls)
+async def scrape_action_endpoint(payload: ScrapePayload, user: User = Depends(current_verified_user)) -> list[str]:
+    async with scrape_limiter.slot(str(user.id)):
+        return await run_scrape_job(scrape_action, payload.urls)
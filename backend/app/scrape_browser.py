@@ -0,0 +1,69 @@
+"""Streaming, size-capped page fetcher for the scrape workers."""
+from __future__ import annotations
+
+import httpx
+from extract_emails.browsers import HttpxBrowser
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+class StreamingHttpxBrowser(HttpxBrowser):
+    """HttpxBrowser that never buffers more than ``max_bytes`` of a page.
+
+    Headers are inspected before the body is read: non-HTML responses (PDFs,
+    images, archives...) and responses whose declared Content-Length exceeds
+    the cap are skipped without downloading them. Bodies without a declared
+    length are streamed and the connection is closed once the cap is hit.
+    """
+
+    def __init__(self, max_bytes: int, timeout: float = 15.0, headers: dict[str, str] | None = None) -> None:
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.request_headers = headers or {
+            "User-Agent": "Mozilla/5.0 (compatible; SponsorBot/1.0)",
+            "Accept": "text/html,application/xhtml+xml;q=0.9,text/plain;q=0.8",
+        }
+        self.client: httpx.Client | None = None
+        self.skipped = 0
+
+    def start(self) -> None:
+        self.client = httpx.Client(headers=self.request_headers, timeout=self.timeout, follow_redirects=True)
+
+    def stop(self) -> None:
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    def _acceptable(self, response: httpx.Response) -> bool:
+        if response.status_code >= 400:
+            return False
+        content_type = response.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            return False
+        length = response.headers.get("content-length", "")
+        return not (length.isdigit() and int(length) > self.max_bytes)
+
+    def get_page_source(self, url: str) -> str:
+        if self.client is None:
+            self.start()
+        assert self.client is not None
+
+        try:
+            with self.client.stream("GET", url) as response:
+                if not self._acceptable(response):
+                    self.skipped += 1
+                    return ""
+                body = bytearray()
+                for chunk in response.iter_bytes():
+                    body += chunk[: self.max_bytes - len(body)]
+                    if len(body) >= self.max_bytes:
+                        break
+                encoding = response.charset_encoding or "utf-8"
+        except httpx.HTTPError:
+            return ""
+
+        try:
+            return body.decode(encoding, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
@@ -1,11 +1,46 @@
+from __future__ import annotations
+
 import re
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
 from extract_emails.data_extractors import DataExtractor
 from extract_emails.utils import email_filter
 
+from .contact_extractors import (
+    EMAIL,
+    ContactExtractor,
+    ExtractedContact,
+    ParsedPage,
+    register_extractor,
+    registered_extractors,
+    run_extractors,
+)
+
+if TYPE_CHECKING:
+    from .page_fingerprints import FingerprintStore
+
+CHUNK_SIZE = 64 * 1024
+# Matches ending this close to a window edge may be cut off; they are picked up
+# again from the carried-over tail of the next window instead.
+EDGE_GUARD = 320
+# Raw text carried into the next window; obfuscations like " at " shrink by at
+# most 4x when normalized, so this always covers EDGE_GUARD plus one email.
+CHUNK_OVERLAP = 4 * (EDGE_GUARD + 320)
+
+CF_EMAIL_PATTERN = re.compile(r"""data-cfemail\s*=\s*["']?([0-9a-fA-F]+)""")
+
+
+def iter_chunks(text: str, size: int = CHUNK_SIZE) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
 
+@register_extractor
 class AdvancedEmailExtractor(DataExtractor):
+    kind = EMAIL
+
     def __init__(self):
         self.email_pattern = re.compile(
             r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}",
@@ -50,20 +85,111 @@ class AdvancedEmailExtractor(DataExtractor):
         return False
 
     def get_data(self, page_source: str) -> set[str]:
-        emails = set()
-
-        cleaned_text = self.preprocess(page_source)
-        for match in self.email_pattern.findall(cleaned_text):
-            if not self.is_junk(match):
-                emails.add(match.lower())
-
-        soup = BeautifulSoup(page_source, "html.parser")
-        cf_elements = soup.select("[data-cfemail]")
-        for elem in cf_elements:
-            encoded = str(elem.get("data-cfemail"))
-            if encoded:
-                decoded = self.cf_decode_email(encoded)
-                if not self.is_junk(decoded):
-                    emails.add(decoded.lower())
+        return self.extract(page_source)
+
+    def extract_contacts(self, page: ParsedPage) -> set[ExtractedContact]:
+        """Emails from the raw markup (as :meth:`extract` finds them, including
+        scripts, JSON-LD and attribute values), the visible text with entities
+        decoded (addresses split by tags or written as ``&#64;``), and the
+        ``data-cfemail``/percent-encoded ``mailto:`` attributes found while parsing."""
+
+        emails = self.scan_chunks(iter_chunks(page.html))
+        emails |= self.scan_chunks(iter_chunks(page.text), cloudflare=False)
+        for encoded, mailto in page.email_attributes:
+            email = self._decode_attribute(encoded) if encoded else unquote(mailto).strip()
+            if email and self.email_pattern.fullmatch(email) and not self.is_junk(email):
+                emails.add(email.lower())
+        return {ExtractedContact(EMAIL, email) for email in email_filter(emails)}
+
+    def _decode_attribute(self, encoded: str) -> str | None:
+        try:
+            return self.cf_decode_email(encoded)
+        except ValueError:
+            return None
+
+    def extract(self, page_source: str) -> set[str]:
+        """Full extraction: regex over de-obfuscated text plus Cloudflare-protected emails."""
+        return self.scan_chunks(iter_chunks(page_source))
+
+    def scan_chunks(self, chunks: Iterable[str], cloudflare: bool = True) -> set[str]:
+        """Scan text chunk by chunk so working memory stays bounded by the chunk size.
+
+        Each window is the previous window's tail plus the next chunk. Matches
+        touching a window edge are skipped (except at the very start/end of
+        the text) because the overlap guarantees they reappear whole in the
+        neighbouring window. ``cloudflare=False`` skips the ``data-cfemail``
+        scan for text that has no attributes left.
+        """
+        emails: set[str] = set()
+        chunk_iter = iter(chunks)
+        carry = ""
+        current = next(chunk_iter, None)
+        while current is not None:
+            following = next(chunk_iter, None)
+            window = carry + current
+            self._scan_window(window, emails, not carry, following is None, cloudflare)
+            carry = window[-CHUNK_OVERLAP:]
+            current = following
 
         return email_filter(emails)
+
+    def _scan_window(self, window: str, emails: set[str], at_start: bool, at_end: bool, cloudflare: bool) -> None:
+        def complete(match: re.Match[str], length: int) -> bool:
+            return (at_start or match.start() > 0) and (at_end or match.end() <= length - EDGE_GUARD)
+
+        cleaned_text = self.preprocess(window)
+        for match in self.email_pattern.finditer(cleaned_text):
+            if complete(match, len(cleaned_text)) and not self.is_junk(match.group()):
+                emails.add(match.group().lower())
+
+        if not cloudflare:
+            return
+        for match in CF_EMAIL_PATTERN.finditer(window):
+            if not complete(match, len(window)):
+                continue
+            decoded = self._decode_attribute(match.group(1))
+            if decoded and "@" in decoded and not self.is_junk(decoded):
+                emails.add(decoded.lower())
+
+
+class ContactPipeline(DataExtractor):
+    """Run every contact extractor over one parse of each fetched page.
+
+    Registered with ``extract_emails`` as its only data extractor, so the
+    worker fetches a page once and every field is collected from the same
+    :class:`ParsedPage`. Pages whose exact markup the fingerprint store has
+    already seen reuse their stored contacts without being parsed. ``get_data`` returns the emails (what the worker
+    keeps in ``page.data["email"]``); all contact kinds accumulate in
+    :attr:`contacts`.
+    """
+
+    def __init__(
+        self,
+        fingerprints: FingerprintStore | None = None,
+        site: str = "",
+        extractors: Iterable[ContactExtractor] | None = None,
+    ):
+        self.fingerprints = fingerprints
+        self.site = site
+        self.extractors = list(extractors) if extractors is not None else registered_extractors()
+        self.contacts: set[ExtractedContact] = set()
+
+    @property
+    def name(self) -> str:
+        return EMAIL
+
+    def get_data(self, page_source: str) -> set[str]:
+        contacts = self.extract(page_source)
+        self.contacts |= contacts
+        return {contact.value for contact in contacts if contact.kind == EMAIL}
+
+    def extract(self, page_source: str) -> set[ExtractedContact]:
+        if self.fingerprints is None:
+            return run_extractors(ParsedPage(page_source), self.extractors)
+
+        key, cached = self.fingerprints.lookup(page_source)
+        if cached is not None:
+            return set(cached)
+        contacts = run_extractors(ParsedPage(page_source), self.extractors)
+        self.fingerprints.add(self.site, key, contacts)
+        return contacts
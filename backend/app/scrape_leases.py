@@ -0,0 +1,262 @@
+"""Lease-based distribution of scrape targets across scraper nodes.
+
+Every node claims a batch of pending targets, keeps the lease alive with a
+heartbeat while it scrapes, and writes results back idempotently. Targets
+whose lease expired (crashed or stalled node) become claimable again.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import uuid
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import etags, stats
+from .admission import run_scrape_job
+from .config import get_settings
+from .database import async_session_maker, dialect_insert
+from .contact_extractors import EMAIL, ExtractedContact
+from .leases import utcnow
+from .models import Contact, EmailRecord, EmailScrapeTarget
+from .page_fingerprints import FingerprintStore, load_store, persist_store
+from .scrape_actions import scrape_contacts
+
+settings = get_settings()
+
+# Loaded once per process and shared by every drain, node loop and dashboard
+# scrape; batches persist what they add, so the table only seeds it.
+_fingerprints: FingerprintStore | None = None
+_fingerprints_lock = asyncio.Lock()
+
+
+@dataclass(frozen=True)
+class ClaimedTarget:
+    id: uuid.UUID
+    url: str
+
+
+@dataclass
+class BatchResult:
+    targets: int = 0
+    emails_found: int = 0
+    emails_added: int = 0
+    contacts_found: int = 0
+
+
+def _claimable(now: datetime):
+    return and_(
+        EmailScrapeTarget.scraped_at.is_(None),
+        or_(EmailScrapeTarget.lease_expires_at.is_(None), EmailScrapeTarget.lease_expires_at < now),
+    )
+
+
+async def claim_targets(
+    session: AsyncSession, node_id: str, batch_size: int, lease_seconds: int
+) -> list[ClaimedTarget]:
+    """Atomically lease up to ``batch_size`` pending or expired targets to ``node_id``.
+
+    On PostgreSQL the candidate rows are locked with ``FOR UPDATE SKIP LOCKED``
+    so concurrent nodes never block on (or double-claim) the same rows. SQLite
+    drops the locking clause; its single-writer UPDATE gives the same guarantee.
+    """
+
+    now = utcnow()
+    candidates = (
+        select(EmailScrapeTarget.id)
+        .where(_claimable(now))
+        .order_by(EmailScrapeTarget.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(EmailScrapeTarget)
+        .where(EmailScrapeTarget.id.in_(candidates.scalar_subquery()), _claimable(now))
+        .values(lease_owner=node_id, lease_expires_at=now + timedelta(seconds=lease_seconds))
+        .returning(EmailScrapeTarget.id, EmailScrapeTarget.url)
+        .execution_options(synchronize_session=False)
+    )
+    rows = (await session.execute(stmt)).all()
+    await session.commit()
+    return [ClaimedTarget(id=row.id, url=row.url) for row in rows]
+
+
+def _owned(node_id: str, target_ids: Sequence[uuid.UUID]):
+    return and_(
+        EmailScrapeTarget.id.in_(target_ids),
+        EmailScrapeTarget.lease_owner == node_id,
+        EmailScrapeTarget.scraped_at.is_(None),
+    )
+
+
+async def renew_leases(
+    session: AsyncSession, node_id: str, target_ids: Sequence[uuid.UUID], lease_seconds: int
+) -> int:
+    """Extend the leases this node still holds; returns how many were renewed."""
+
+    result = await session.execute(
+        update(EmailScrapeTarget)
+        .where(_owned(node_id, target_ids))
+        .values(lease_expires_at=utcnow() + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def release_targets(session: AsyncSession, node_id: str, target_ids: Sequence[uuid.UUID]) -> None:
+    """Hand unfinished targets back immediately instead of waiting for expiry."""
+
+    await session.execute(
+        update(EmailScrapeTarget)
+        .where(_owned(node_id, target_ids))
+        .values(lease_owner=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+async def complete_targets(
+    session: AsyncSession,
+    node_id: str,
+    target_ids: Sequence[uuid.UUID],
+    emails: Sequence[str],
+    contacts: Mapping[uuid.UUID, Iterable[ExtractedContact]] | None = None,
+) -> tuple[int, int]:
+    """Store scraped emails and contacts and mark the batch done; safe to repeat.
+
+    Emails are inserted with ``ON CONFLICT DO NOTHING`` and only targets still
+    leased to ``node_id`` are marked scraped (and get their ``contacts``
+    rows), so a retried or late completion (after another node reclaimed the
+    lease) neither duplicates nor miscounts.
+    Returns ``(targets_completed, emails_added)``.
+    """
+
+    added = 0
+    if emails:
+        now = utcnow()
+        stmt = dialect_insert(session, EmailRecord).values(
+            [{"id": uuid.uuid4(), "email": email, "created_at": now, "send_count": 0} for email in emails]
+        )
+        stmt = stmt.on_conflict_do_nothing(index_elements=[EmailRecord.email]).returning(EmailRecord.id)
+        added = len((await session.execute(stmt)).all())
+
+    completed_ids = (
+        await session.execute(
+            update(EmailScrapeTarget)
+            .where(_owned(node_id, target_ids))
+            .values(scraped_at=utcnow(), lease_owner=None, lease_expires_at=None)
+            .returning(EmailScrapeTarget.id)
+            .execution_options(synchronize_session=False)
+        )
+    ).scalars().all()
+    completed = len(completed_ids)
+    if contacts:
+        await _insert_contacts(session, {target_id: contacts.get(target_id, ()) for target_id in completed_ids})
+
+    await stats.bump(
+        session,
+        {stats.EMAILS: added, stats.WEBSITES: -completed, stats.EMAIL_SCRAPE_RUNS: 1},
+        growth={stats.EMAILS: added},
+    )
+    await etags.bump_versions(session, etags.EMAILS, etags.WEBSITES)
+    await session.commit()
+    return completed, added
+
+
+async def _insert_contacts(session: AsyncSession, contacts: Mapping[uuid.UUID, Iterable[ExtractedContact]]) -> None:
+    now = utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "target_id": target_id,
+            "kind": contact.kind,
+            "value": contact.value[:512],
+            "label": contact.label[:64] if contact.label else None,
+            "created_at": now,
+        }
+        for target_id, found in contacts.items()
+        for contact in found
+    ]
+    if rows:
+        stmt = dialect_insert(session, Contact).values(rows)
+        await session.execute(stmt.on_conflict_do_nothing(index_elements=[Contact.target_id, Contact.kind, Contact.value]))
+
+
+async def _heartbeat(node_id: str, target_ids: Sequence[uuid.UUID], lease_seconds: int) -> None:
+    interval = max(lease_seconds / 3, 1)
+    while True:
+        await asyncio.sleep(interval)
+        async with async_session_maker() as session:
+            await renew_leases(session, node_id, target_ids, lease_seconds)
+
+
+async def load_fingerprints(session: AsyncSession) -> FingerprintStore:
+    """The process-wide fingerprint store, read from the database on first use."""
+
+    global _fingerprints
+    async with _fingerprints_lock:
+        if _fingerprints is None:
+            _fingerprints = await load_store(session, settings.fingerprint_store_size)
+    return _fingerprints
+
+
+async def process_batch(
+    session: AsyncSession,
+    node_id: str,
+    batch: Sequence[ClaimedTarget],
+    lease_seconds: int,
+    fingerprints: FingerprintStore | None = None,
+) -> BatchResult:
+    """Scrape a claimed batch while a heartbeat keeps its leases alive."""
+
+    target_ids = [target.id for target in batch]
+    heartbeat = asyncio.create_task(_heartbeat(node_id, target_ids, lease_seconds))
+    try:
+        found = await run_scrape_job(scrape_contacts, [target.url for target in batch], fingerprints)
+    except Exception:
+        await release_targets(session, node_id, target_ids)
+        raise
+    finally:
+        heartbeat.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat
+
+    contacts = {target.id: found.get(target.url, set()) for target in batch}
+    emails = sorted({contact.value for items in contacts.values() for contact in items if contact.kind == EMAIL})
+    completed, added = await complete_targets(session, node_id, target_ids, emails, contacts)
+    if fingerprints is not None:
+        await persist_store(session, fingerprints)
+    return BatchResult(
+        targets=completed,
+        emails_found=len(emails),
+        emails_added=added,
+        contacts_found=sum(len(items) for items in contacts.values()),
+    )
+
+
+async def drain_targets(
+    session: AsyncSession,
+    node_id: str,
+    batch_size: int | None = None,
+    lease_seconds: int | None = None,
+) -> BatchResult:
+    """Claim and scrape batches until no claimable target is left."""
+
+    batch_size = batch_size or settings.scrape_batch_size
+    lease_seconds = lease_seconds or settings.scrape_lease_seconds
+    total = BatchResult()
+    fingerprints: FingerprintStore | None = None
+    while batch := await claim_targets(session, node_id, batch_size, lease_seconds):
+        if fingerprints is None:
+            fingerprints = await load_fingerprints(session)
+        result = await process_batch(session, node_id, batch, lease_seconds, fingerprints)
+        total.targets += result.targets
+        total.emails_found += result.emails_found
+        total.emails_added += result.emails_added
+        total.contacts_found += result.contacts_found
+    return total
@@ -0,0 +1,54 @@
+"""Standalone scraper node: ``python -m app.scrape_worker``.
+
+Run one process per machine (or container); nodes coordinate purely through
+target leases in the database, so throughput grows with the number of nodes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from .config import get_settings
+from .database import async_session_maker
+from .leases import new_node_id
+from .scrape_leases import claim_targets, load_fingerprints, process_batch
+
+settings = get_settings()
+
+
+async def run_node(node_id: str, batch_size: int, lease_seconds: int, poll_seconds: float, once: bool) -> None:
+    """Claim and scrape batches forever, idling ``poll_seconds`` when nothing is pending."""
+
+    async with async_session_maker() as session:
+        fingerprints = await load_fingerprints(session)
+        while True:
+            batch = await claim_targets(session, node_id, batch_size, lease_seconds)
+            if not batch:
+                if once:
+                    return
+                await asyncio.sleep(poll_seconds)
+                continue
+            result = await process_batch(session, node_id, batch, lease_seconds, fingerprints)
+            print(
+                f"[{node_id}] scraped {result.targets} targets, "
+                f"found {result.emails_found} emails ({result.emails_added} new), "
+                f"{result.contacts_found} contacts, "
+                f"fingerprint hits {fingerprints.hits}/{fingerprints.hits + fingerprints.misses}",
+                flush=True,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a lease-based scraper node.")
+    parser.add_argument("--node-id", default=new_node_id())
+    parser.add_argument("--batch-size", type=int, default=settings.scrape_batch_size)
+    parser.add_argument("--lease-seconds", type=int, default=settings.scrape_lease_seconds)
+    parser.add_argument("--poll-seconds", type=float, default=settings.scrape_poll_seconds)
+    parser.add_argument("--once", action="store_true", help="exit when no target is claimable")
+    args = parser.parse_args()
+
+    asyncio.run(run_node(args.node_id, args.batch_size, args.lease_seconds, args.poll_seconds, args.once))
+
+
+if __name__ == "__main__":
+    main()
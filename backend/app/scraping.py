@@ -1,31 +1,27 @@
 from __future__ import annotations
 
-from typing import Sequence
-import asyncio
-
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .scrape_actions import scrape_action, search_action
+from . import etags, stats
+from .admission import run_scrape_job
+from .scrape_actions import search_action
+from .leases import new_node_id
+from .scrape_leases import drain_targets
 
-from .models import EmailRecord, EmailScrapeTarget, EmailTemplate, SearchScrapeQuery
+from .models import EmailScrapeTarget, SearchScrapeQuery
 
 
 async def scrape_email_targets(session: AsyncSession) -> str:
-    """Collect websites marked for scraping."""
+    """Collect websites marked for scraping.
 
-    result = await session.execute(select(EmailScrapeTarget.url))
-    websites = result.scalars().all()
-    
-    emails = await asyncio.to_thread(scrape_action, list(websites))
-    
-    for email in emails:
-        if not (await session.execute(select(EmailRecord).where(EmailRecord.email == email))).scalars().first():
-            session.add(EmailRecord(email=email))
-    await session.execute(delete(EmailScrapeTarget))
-    await session.commit()
-    
-    return f"Found {len(emails)} email addresses from {len(websites)} websites"
+    Acts as a short-lived scraper node: it only takes targets no other node
+    holds a live lease on, so it can run alongside ``app.scrape_worker``.
+    """
+
+    result = await drain_targets(session, new_node_id())
+
+    return f"Found {result.emails_found} email addresses from {result.targets} websites"
 
 
 async def scrape_search_queries(session: AsyncSession) -> str:
@@ -33,23 +29,20 @@ async def scrape_search_queries(session: AsyncSession) -> str:
     result = await session.execute(select(SearchScrapeQuery.query))
     queries = result.scalars().all()
     
-    urls = await asyncio.to_thread(search_action, list(queries))
+    urls = await run_scrape_job(search_action, list(queries))
     
+    added = 0
     for url in urls:
         if not (await session.execute(select(EmailScrapeTarget).where(EmailScrapeTarget.url == url))).scalars().first():
             session.add(EmailScrapeTarget(url=url))
-    await session.execute(delete(SearchScrapeQuery))
+            added += 1
+    removed = (await session.execute(delete(SearchScrapeQuery))).rowcount
+    await stats.bump(
+        session,
+        {stats.WEBSITES: added, stats.QUERIES: -removed, stats.SEARCH_SCRAPE_RUNS: 1},
+        growth={stats.WEBSITES: added},
+    )
+    await etags.bump_versions(session, etags.WEBSITES, etags.QUERIES)
     await session.commit()
     
     return f"Found {len(urls)} URLs from {len(queries)} search queries"
-
-
-async def send_email_campaign(session: AsyncSession, template: EmailTemplate, emails: Sequence[str]) -> str:
-    """Outline how to send a campaign using the stored template."""
-
-    _ = await session.execute(select(EmailRecord.id).limit(1))
-    
-    return (
-        "Email sending not implemented. Update `scraping.send_email_campaign` to deliver the "
-        f"stored template to {len(emails)} recipients."
-    )
@@ -0,0 +1,141 @@
+"""Static serving for the built frontend.
+
+Compressible files get ``.br``/``.gz`` siblings written once at build time
+(``python -m app.static_files <dist>``, run by CI after ``npm run build``), and
+the best variant the client accepts is served straight from disk. Nothing is
+compressed at startup; a missing or outdated variant just means the file is
+served as is (or compressed on the fly by the middleware). Vite's content-hashed
+``assets/`` files are cached forever; everything else, ``index.html`` included,
+is revalidated with its ETag so unchanged pages cost a 304.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+import brotli
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from .compression import COMPRESSIBLE_TYPES, negotiate_encoding
+
+PRECOMPRESS_SUFFIXES = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".xml", ".webmanifest"}
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# Vite emits assets/<name>-<hash>.<ext>; the hash changes whenever the content does.
+HASHED_ASSET = re.compile(r"(^|/)assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+def _stale(source: Path, target: Path) -> bool:
+    try:
+        return target.stat().st_mtime < source.stat().st_mtime
+    except FileNotFoundError:
+        return True
+
+
+def precompress(directory: Path, minimum_size: int = 1024) -> int:
+    """Write missing or outdated ``.br``/``.gz`` siblings; returns how many were written.
+
+    Directories that are not writable are skipped before any compression work.
+    """
+
+    written = 0
+    for path in directory.rglob("*"):
+        if not path.is_file() or path.suffix not in PRECOMPRESS_SUFFIXES or path.stat().st_size < minimum_size:
+            continue
+        if not os.access(path.parent, os.W_OK):
+            continue
+        data: bytes | None = None
+        for suffix, compress in (
+            (".br", lambda raw: brotli.compress(raw, quality=11)),
+            (".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0)),
+        ):
+            target = path.with_name(path.name + suffix)
+            if not _stale(path, target):
+                continue
+            data = data if data is not None else path.read_bytes()
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                continue
+            try:
+                target.write_bytes(compressed)
+            except OSError:
+                continue
+            written += 1
+    return written
+
+
+class FrontendStaticFiles(StaticFiles):
+    """StaticFiles serving existing precompressed variants, with cache policy and SPA fallback."""
+
+    def __init__(self, *, directory: str | os.PathLike[str], **kwargs) -> None:
+        super().__init__(directory=directory, html=True, **kwargs)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as exc:
+            # Client-side routes (no file extension) render the app shell.
+            if exc.status_code != 404 or path.startswith("api/") or "." in path.rsplit("/", 1)[-1]:
+                raise
+            full_path, stat_result = self.lookup_path("index.html")
+            if stat_result is None:
+                raise
+            return self.file_response(full_path, stat_result, scope)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        source = Path(full_path)
+        media_type = mimetypes.guess_type(source.name)[0] or "text/plain"
+        served, served_stat, encoding = source, stat_result, None
+
+        if source.suffix in PRECOMPRESS_SUFFIXES:
+            encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+            variant = source.with_name(source.name + ENCODING_SUFFIXES[encoding]) if encoding else None
+            try:
+                variant_stat = variant.stat() if variant is not None else None
+            except FileNotFoundError:
+                variant_stat = None
+            if variant is not None and variant_stat is not None and variant_stat.st_mtime >= stat_result.st_mtime:
+                served, served_stat = variant, variant_stat
+            else:
+                encoding = None
+
+        response = FileResponse(served, status_code=status_code, stat_result=served_stat, media_type=media_type)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            response.headers.add_vary_header("Accept-Encoding")
+        relative = Path(os.path.relpath(source, os.path.realpath(self.directory or "."))).as_posix()
+        response.headers["Cache-Control"] = IMMUTABLE if HASHED_ASSET.search(relative) else REVALIDATE
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompress a built frontend (writes .br/.gz next to each file).")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--minimum-size", type=int, default=1024)
+    args = parser.parse_args()
+    print(f"wrote {precompress(args.directory, args.minimum_size)} compressed files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Incrementally maintained aggregates backing the dashboard summary."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta, timezone
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import dialect_insert
+from .models import DashboardDailyStat, DashboardStat
+from .schemas import DashboardGrowthPoint, DashboardSummary
+
+# Gauges mirroring table sizes (seeded by migration 0002).
+WEBSITES = "websites"
+QUERIES = "queries"
+EMAILS = "emails"
+EMAILS_SENT = "emails_sent"
+# Monotonic counters; their ``updated_at`` doubles as "last run" timestamp.
+MESSAGES_SENT = "messages_sent"
+EMAIL_SCRAPE_RUNS = "email_scrape_runs"
+SEARCH_SCRAPE_RUNS = "search_scrape_runs"
+EMAIL_SEND_RUNS = "email_send_runs"
+
+GROWTH_DAYS = 30
+SUMMARY_TTL_SECONDS = 5.0
+
+_summary_cache: tuple[float, DashboardSummary] | None = None
+
+
+def invalidate_summary_cache() -> None:
+    """Drop the in-process summary so the next read hits the database."""
+
+    global _summary_cache
+    _summary_cache = None
+
+
+async def bump(
+    session: AsyncSession,
+    deltas: Mapping[str, int],
+    *,
+    growth: Mapping[str, int] | None = None,
+) -> None:
+    """Apply counter deltas (and optional daily growth) inside the caller's transaction.
+
+    Every statement is an upsert, so concurrent writers never lose increments.
+    The caller is responsible for committing.
+    """
+
+    now = datetime.now(timezone.utc)
+    for name, delta in deltas.items():
+        if not delta:
+            continue
+        stmt = dialect_insert(session, DashboardStat).values(name=name, value=delta, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DashboardStat.name],
+            set_={"value": DashboardStat.value + stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        )
+        await session.execute(stmt)
+
+    today = now.date()
+    for name, delta in (growth or {}).items():
+        if not delta:
+            continue
+        stmt = dialect_insert(session, DashboardDailyStat).values(day=today, name=name, value=delta)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DashboardDailyStat.day, DashboardDailyStat.name],
+            set_={"value": DashboardDailyStat.value + stmt.excluded.value},
+        )
+        await session.execute(stmt)
+
+    invalidate_summary_cache()
+
+
+def _growth(rows: list[DashboardDailyStat], since: date) -> list[DashboardGrowthPoint]:
+    points = {since + timedelta(days=offset): DashboardGrowthPoint(day=since + timedelta(days=offset)) for offset in range(GROWTH_DAYS)}
+    for row in rows:
+        point = points.get(row.day)
+        if point is not None and row.name in DashboardGrowthPoint.model_fields:
+            setattr(point, row.name, row.value)
+    return list(points.values())
+
+
+async def get_summary(session: AsyncSession) -> DashboardSummary:
+    """Return the dashboard summary, served from a short-lived in-process cache."""
+
+    global _summary_cache
+    now = time.monotonic()
+    if _summary_cache is not None and now - _summary_cache[0] < SUMMARY_TTL_SECONDS:
+        return _summary_cache[1]
+
+    stats = {row.name: row for row in (await session.execute(select(DashboardStat))).scalars().all()}
+    since = datetime.now(timezone.utc).date() - timedelta(days=GROWTH_DAYS - 1)
+    daily = await session.execute(select(DashboardDailyStat).where(DashboardDailyStat.day >= since))
+
+    def value(name: str) -> int:
+        return stats[name].value if name in stats else 0
+
+    def last_run(name: str) -> datetime | None:
+        return stats[name].updated_at if name in stats else None
+
+    summary = DashboardSummary(
+        websites=value(WEBSITES),
+        queries=value(QUERIES),
+        emails=value(EMAILS),
+        emails_sent=value(EMAILS_SENT),
+        emails_never_sent=max(value(EMAILS) - value(EMAILS_SENT), 0),
+        messages_sent=value(MESSAGES_SENT),
+        last_email_scrape_at=last_run(EMAIL_SCRAPE_RUNS),
+        last_search_scrape_at=last_run(SEARCH_SCRAPE_RUNS),
+        last_email_send_at=last_run(EMAIL_SEND_RUNS),
+        growth=_growth(list(daily.scalars().all()), since),
+    )
+    _summary_cache = (now, summary)
+    return summary
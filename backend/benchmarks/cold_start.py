@@ -0,0 +1,97 @@
+"""Measure worker cold start: import time and time until the first request is served.
+
+Run from ``backend/`` against a migrated database::
+
+    python benchmarks/cold_start.py --runs 5
+
+Each run uses a fresh interpreter so nothing is shared between samples.
+"""
+from __future__ import annotations
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("ddgs", "extract_emails", "bs4", "httpx")
+
+IMPORT_PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import() -> tuple[float, str]:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), output[1] if len(output) > 1 else ""
+
+
+def measure_first_request(timeout: float) -> float:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"server did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<22} median {statistics.median(samples) * 1000:8.1f} ms"
+        f"  min {min(samples) * 1000:8.1f} ms  max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    imports: list[float] = []
+    loaded_heavy: set[str] = set()
+    for _ in range(args.runs):
+        elapsed, loaded = measure_import()
+        imports.append(elapsed)
+        loaded_heavy.update(filter(None, loaded.split(",")))
+    first_requests = [measure_first_request(args.timeout) for _ in range(args.runs)]
+
+    _report("import app.main", imports)
+    _report("first /api/health", first_requests)
+    print(f"scrape deps loaded at import: {', '.join(sorted(loaded_heavy)) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Drive a mix of authenticated reads and writes and report per-endpoint latency.
+
+Seed a database first (``benchmarks/seed_data.py``), then run from ``backend/``::
+
+    DATABASE_URL=sqlite+aiosqlite:///./loadtest.db python benchmarks/load_test.py --duration 60 --concurrency 32
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/load_test.py --workers 4
+
+A local uvicorn is started with the same environment unless ``--base-url``
+points at a running app. ``--mix summary=50,websites=0`` overrides scenario
+weights.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Samples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+@dataclass
+class Client:
+    http: httpx.AsyncClient
+    rng: random.Random
+    users: list[str]
+    password: str
+    record: Callable[[str, float, bool], None]
+    admin: bool = False
+    etags: dict[str, str] = field(default_factory=dict)
+
+    async def call(self, label: str, method: str, path: str, *, ok: tuple[int, ...] = (200,), **kwargs) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self.http.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            self.record(label, time.perf_counter() - start, False)
+            raise
+        self.record(label, time.perf_counter() - start, response.status_code in ok)
+        return response
+
+
+Scenario = Callable[[Client], Awaitable[None]]
+
+
+async def summary(client: Client) -> None:
+    await client.call("GET summary", "GET", "/api/dashboard/summary")
+
+
+async def _list(client: Client, resource: str) -> None:
+    await client.call(f"GET {resource}", "GET", f"/api/dashboard/{resource}")
+
+
+async def _conditional_list(client: Client, resource: str) -> None:
+    headers = {"If-None-Match": client.etags[resource]} if resource in client.etags else {}
+    response = await client.call(f"GET {resource} (etag)", "GET", f"/api/dashboard/{resource}", ok=(200, 304), headers=headers)
+    if "etag" in response.headers:
+        client.etags[resource] = response.headers["etag"]
+
+
+async def add_and_remove_website(client: Client) -> None:
+    url = f"https://loadtest-{uuid.uuid4().hex}.example.com"
+    response = await client.call("POST websites", "POST", "/api/dashboard/websites", ok=(201,), json={"url": url})
+    if response.status_code == 201:
+        await client.call("DELETE websites", "DELETE", f"/api/dashboard/websites/{response.json()['id']}", ok=(204,))
+
+
+async def add_query(client: Client) -> None:
+    query = f"loadtest query {uuid.uuid4().hex}"
+    await client.call("POST queries", "POST", "/api/dashboard/queries", ok=(201,), json={"query": query})
+
+
+async def bulk_emails(client: Client) -> None:
+    emails = [f"loadtest-{uuid.uuid4().hex}@example.com" for _ in range(50)]
+    await client.call("POST emails/bulk", "POST", "/api/dashboard/emails/bulk", json={"emails": emails})
+
+
+async def admin_users(client: Client) -> None:
+    await client.call("GET admin/users", "GET", "/api/admin/users")
+
+
+async def me(client: Client) -> None:
+    await client.call("GET me", "GET", "/api/me")
+
+
+async def login(client: Client) -> None:
+    await client.call(
+        "POST login",
+        "POST",
+        "/api/auth/jwt/login",
+        data={"username": client.rng.choice(client.users), "password": client.password},
+        headers={"Authorization": ""},
+    )
+
+
+SCENARIOS: dict[str, tuple[Scenario, int]] = {
+    "summary": (summary, 25),
+    "me": (me, 15),
+    "websites": (lambda client: _list(client, "websites"), 5),
+    "websites_etag": (lambda client: _conditional_list(client, "websites"), 15),
+    "queries": (lambda client: _list(client, "queries"), 5),
+    "queries_etag": (lambda client: _conditional_list(client, "queries"), 10),
+    # Full email list is the heaviest read; keep it rare so it does not dominate.
+    "emails": (lambda client: _list(client, "emails"), 1),
+    "add_website": (add_and_remove_website, 8),
+    "add_query": (add_query, 5),
+    "bulk_emails": (bulk_emails, 2),
+    "admin_users": (admin_users, 1),
+    "login": (login, 3),
+}
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    weights = {name: weight for name, (_, weight) in SCENARIOS.items()}
+    for part in filter(None, spec.split(",")):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        weights[name] = int(weight)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/api/health", timeout=1).status_code == 200:
+                return server, base_url
+        except httpx.HTTPError:
+            time.sleep(0.05)
+    server.terminate()
+    raise TimeoutError("server did not start within 30s")
+
+
+async def get_token(http: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await http.post("/api/auth/jwt/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    index = min(int(round(fraction * (len(sorted_samples) - 1))), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+
+def report(results: dict[str, Samples], elapsed: float) -> None:
+    print(f"{'endpoint':<24}{'count':>8}{'err':>6}{'rps':>9}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    total = Samples()
+    for label in sorted(results):
+        samples = results[label]
+        total.latencies += samples.latencies
+        total.errors += samples.errors
+        _report_line(label, samples, elapsed)
+    _report_line("TOTAL", total, elapsed)
+
+
+def _report_line(label: str, samples: Samples, elapsed: float) -> None:
+    latencies = sorted(samples.latencies)
+    if not latencies:
+        return
+    print(
+        f"{label:<24}{len(latencies):>8}{samples.errors:>6}{len(latencies) / elapsed:>9.1f}"
+        f"{statistics.median(latencies) * 1000:>10.1f}{_percentile(latencies, 0.9) * 1000:>10.1f}"
+        f"{_percentile(latencies, 0.99) * 1000:>10.1f}{latencies[-1] * 1000:>10.1f}"
+    )
+
+
+async def run(args: argparse.Namespace, base_url: str) -> None:
+    weights = parse_mix(args.mix)
+    names = list(weights)
+    results: dict[str, Samples] = defaultdict(Samples)
+
+    def record(label: str, latency: float, ok: bool) -> None:
+        samples = results[label]
+        samples.latencies.append(latency)
+        samples.errors += not ok
+
+    users = [f"loadtest-{i}@example.com" for i in range(args.users)]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as bootstrap:
+        # loadtest-0 is the superuser; the others are verified regular users.
+        tokens = await asyncio.gather(
+            *(get_token(bootstrap, users[i % len(users)], args.password) for i in range(args.concurrency))
+        )
+
+    async def worker(index: int, deadline: float) -> None:
+        headers = {"Authorization": f"Bearer {tokens[index]}"}
+        async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=args.timeout) as http:
+            client = Client(http, random.Random(args.seed + index), users, args.password, record, admin=index % len(users) == 0)
+            # Only the superuser may list users; the others pick from the rest of the mix.
+            allowed = [name for name in names if client.admin or name != "admin_users"]
+            if not allowed:
+                return
+            allowed_weights = [weights[name] for name in allowed]
+            while time.perf_counter() < deadline:
+                name = client.rng.choices(allowed, weights=allowed_weights)[0]
+                try:
+                    await SCENARIOS[name][0](client)
+                except httpx.HTTPError:
+                    pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i, start + args.duration) for i in range(args.concurrency)))
+    report(results, time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="target a running app instead of starting one")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the local server")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent virtual users")
+    parser.add_argument("--users", type=int, default=100, help="seeded loadtest-<n> accounts to log in as")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mix", default="", help="scenario weights, e.g. summary=50,emails=0")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = start_server(args.workers)
+    try:
+        asyncio.run(run(args, base_url))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Fill the configured database with load-test volumes of data.
+
+Run from ``backend/`` (uses ``DATABASE_URL`` like the app)::
+
+    python benchmarks/seed_data.py --emails 2000000 --targets 50000 --queries 20000 --users 10000
+
+The schema is migrated first. Rows go in through executemany batches and the
+dashboard gauges are recomputed from the table counts afterwards. Seeded users
+are ``loadtest-<n>@example.com`` (``loadtest-0`` is a superuser), all verified
+and sharing ``--password``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi_users.password import PasswordHelper  # noqa: E402
+from sqlalchemy import func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app import etags, stats  # noqa: E402
+from app.database import async_session_maker, dialect_insert  # noqa: E402
+from app.models import DashboardStat, EmailRecord, EmailScrapeTarget, SearchScrapeQuery, User  # noqa: E402
+
+SEED_DAYS = 90
+DOMAINS = ("gmail.com", "outlook.com", "yahoo.com", "proton.me", "icloud.com")
+
+
+def _created_at(rng: random.Random, now: datetime) -> datetime:
+    return now - timedelta(seconds=rng.randrange(SEED_DAYS * 86400))
+
+
+def email_rows(rng: random.Random, now: datetime, count: int) -> Iterator[dict]:
+    for i in range(count):
+        sent = rng.random() < 0.3
+        yield {
+            "id": uuid.uuid4(),
+            "email": f"seed-{i}@{rng.choice(DOMAINS) if i % 4 else f'company{i % 5000}.example.com'}",
+            "created_at": _created_at(rng, now),
+            "send_count": rng.randint(1, 4) if sent else 0,
+            "last_sent_at": now - timedelta(days=rng.randrange(30)) if sent else None,
+        }
+
+
+def target_rows(rng: random.Random, now: datetime, count: int) -> Iterator[dict]:
+    for i in range(count):
+        yield {
+            "id": uuid.uuid4(),
+            "url": f"https://seed-{i}.example.com/contact",
+            "created_at": _created_at(rng, now),
+            # Most targets have been scraped already and are kept as tombstones.
+            "scraped_at": now - timedelta(days=rng.randrange(30)) if rng.random() < 0.7 else None,
+        }
+
+
+def query_rows(rng: random.Random, now: datetime, count: int) -> Iterator[dict]:
+    for i in range(count):
+        yield {"id": uuid.uuid4(), "query": f"seed sponsor query {i}", "created_at": _created_at(rng, now)}
+
+
+def user_rows(password: str, count: int) -> Iterator[dict]:
+    # One hash for everyone: hashing millions of passwords is not what we measure.
+    hashed = PasswordHelper().hash(password)
+    for i in range(count):
+        yield {
+            "id": uuid.uuid4(),
+            "email": f"loadtest-{i}@example.com",
+            "hashed_password": hashed,
+            "is_active": True,
+            "is_superuser": i == 0,
+            "is_verified": True,
+            "full_name": f"Load Test {i}",
+        }
+
+
+async def insert_rows(session: AsyncSession, model: type, rows: Iterator[dict], batch_size: int) -> int:
+    inserted = 0
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            await session.execute(insert(model.__table__), batch)
+            await session.commit()
+            inserted += len(batch)
+            batch = []
+    if batch:
+        await session.execute(insert(model.__table__), batch)
+        await session.commit()
+        inserted += len(batch)
+    return inserted
+
+
+async def resync_stats(session: AsyncSession) -> None:
+    """Set the dashboard gauges to the real table counts and invalidate every ETag."""
+
+    gauges = {
+        stats.WEBSITES: select(func.count()).select_from(EmailScrapeTarget).where(EmailScrapeTarget.scraped_at.is_(None)),
+        stats.QUERIES: select(func.count()).select_from(SearchScrapeQuery),
+        stats.EMAILS: select(func.count()).select_from(EmailRecord),
+        stats.EMAILS_SENT: select(func.count()).select_from(EmailRecord).where(EmailRecord.send_count > 0),
+    }
+    now = datetime.now(timezone.utc)
+    for name, count in gauges.items():
+        value = (await session.execute(count)).scalar_one()
+        stmt = dialect_insert(session, DashboardStat).values(name=name, value=value, updated_at=now)
+        await session.execute(
+            stmt.on_conflict_do_update(index_elements=[DashboardStat.name], set_={"value": value, "updated_at": now})
+        )
+    await etags.bump_versions(session, etags.WEBSITES, etags.QUERIES, etags.EMAILS)
+    await session.commit()
+
+
+async def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    plan: list[tuple[str, type, Callable[[], Iterator[dict]]]] = [
+        ("users", User, lambda: user_rows(args.password, args.users)),
+        ("targets", EmailScrapeTarget, lambda: target_rows(rng, now, args.targets)),
+        ("queries", SearchScrapeQuery, lambda: query_rows(rng, now, args.queries)),
+        ("emails", EmailRecord, lambda: email_rows(rng, now, args.emails)),
+    ]
+    async with async_session_maker() as session:
+        if (await session.execute(select(User.id).where(User.email == "loadtest-0@example.com"))).first():
+            raise SystemExit("database is already seeded; point DATABASE_URL at a fresh database")
+        for label, model, rows in plan:
+            start = time.perf_counter()
+            count = await insert_rows(session, model, rows(), args.batch_size)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<8} {count:>10,} rows in {elapsed:7.1f} s ({count / max(elapsed, 1e-9):>10,.0f} rows/s)", flush=True)
+        await resync_stats(session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emails", type=int, default=1_000_000)
+    parser.add_argument("--targets", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, check=True)
+    asyncio.run(seed(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Dashboard stats, daily growth and resource version tables
+
+Seeds the gauges from the existing base tables so counters stay correct on
+databases that already hold data.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 11:20:02.118245
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEED_COUNTS = {
+    "websites": "SELECT count(*) FROM email_scrape_targets",
+    "queries": "SELECT count(*) FROM search_scrape_queries",
+    "emails": "SELECT count(*) FROM email_records",
+    "emails_sent": "SELECT count(*) FROM email_records WHERE send_count > 0",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_stats",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_table(
+        "dashboard_daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "name"),
+    )
+    op.create_table(
+        "resource_versions",
+        sa.Column("resource", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("resource"),
+    )
+
+    for name, count_sql in SEED_COUNTS.items():
+        op.execute(
+            f"INSERT INTO dashboard_stats (name, value, updated_at) "
+            f"SELECT '{name}', ({count_sql}), CURRENT_TIMESTAMP"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("resource_versions")
+    op.drop_table("dashboard_daily_stats")
+    op.drop_table("dashboard_stats")
@@ -0,0 +1,32 @@
+"""Lease columns on scrape targets for distributed scraper nodes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 11:20:34.010391
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("email_scrape_targets", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("lease_owner", sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column("scraped_at", sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index("ix_email_scrape_targets_pending", ["scraped_at", "lease_expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("email_scrape_targets", schema=None) as batch_op:
+        batch_op.drop_index("ix_email_scrape_targets_pending")
+        batch_op.drop_column("scraped_at")
+        batch_op.drop_column("lease_expires_at")
+        batch_op.drop_column("lease_owner")
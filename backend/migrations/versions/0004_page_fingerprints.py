@@ -0,0 +1,36 @@
+"""Page fingerprint store for duplicate page detection
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 11:22:58.397251
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "page_fingerprints",
+        sa.Column("hash", sa.String(length=32), nullable=False),
+        sa.Column("site", sa.String(length=255), nullable=False),
+        sa.Column("simhash", sa.BigInteger(), nullable=False),
+        sa.Column("emails", sa.Text(), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_page_fingerprints_last_seen_at"), ["last_seen_at"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_page_fingerprints_last_seen_at"))
+    op.drop_table("page_fingerprints")
@@ -0,0 +1,57 @@
+"""Campaign outbox with per-recipient delivery state
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 11:40:12.518204
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaigns",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("total_recipients", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "campaign_deliveries",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), autoincrement=True, nullable=False),
+        sa.Column("campaign_id", sa.Uuid(), nullable=False),
+        sa.Column("email_record_id", sa.Uuid(), nullable=True),
+        sa.Column("email", sa.String(length=320), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("lease_owner", sa.String(length=128), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaigns.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["email_record_id"], ["email_records.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("campaign_id", "email", name="uq_campaign_deliveries_campaign_email"),
+    )
+    with op.batch_alter_table("campaign_deliveries", schema=None) as batch_op:
+        batch_op.create_index("ix_campaign_deliveries_status", ["status", "id"], unique=False)
+        batch_op.create_index("ix_campaign_deliveries_campaign_status", ["campaign_id", "status"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("campaign_deliveries", schema=None) as batch_op:
+        batch_op.drop_index("ix_campaign_deliveries_campaign_status")
+        batch_op.drop_index("ix_campaign_deliveries_status")
+    op.drop_table("campaign_deliveries")
+    op.drop_table("campaigns")
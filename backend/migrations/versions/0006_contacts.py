@@ -0,0 +1,43 @@
+"""Typed contacts per scrape target and contacts in page fingerprints
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 16:05:41.218734
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contacts",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("target_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("value", sa.String(length=512), nullable=False),
+        sa.Column("label", sa.String(length=64), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["target_id"], ["email_scrape_targets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("target_id", "kind", "value", name="uq_contacts_target_kind_value"),
+    )
+    with op.batch_alter_table("contacts", schema=None) as batch_op:
+        batch_op.create_index("ix_contacts_kind_value", ["kind", "value"], unique=False)
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("contacts", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.drop_column("contacts")
+    with op.batch_alter_table("contacts", schema=None) as batch_op:
+        batch_op.drop_index("ix_contacts_kind_value")
+    op.drop_table("contacts")
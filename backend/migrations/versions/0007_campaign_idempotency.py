@@ -0,0 +1,32 @@
+"""Idempotency and content keys on campaigns
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 17:12:08.604153
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("campaigns", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("idempotency_key", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("content_key", sa.String(length=32), nullable=True))
+        batch_op.create_unique_constraint("uq_campaigns_idempotency_key", ["idempotency_key"])
+        batch_op.create_index("ix_campaigns_content_key", ["content_key"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("campaigns", schema=None) as batch_op:
+        batch_op.drop_index("ix_campaigns_content_key")
+        batch_op.drop_constraint("uq_campaigns_idempotency_key", type_="unique")
+        batch_op.drop_column("content_key")
+        batch_op.drop_column("idempotency_key")
@@ -0,0 +1,26 @@
+"""Contact key on page fingerprints
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 17:48:36.902417
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("contact_key", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.drop_column("contact_key")
@@ -0,0 +1,32 @@
+"""Exact-hash page fingerprints
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 21:12:08.517340
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored hashes were taken over normalized text and can never match a
+    # raw-markup hash; the table is only a cache, so start it over.
+    op.execute("DELETE FROM page_fingerprints")
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.drop_column("contact_key")
+        batch_op.drop_column("simhash")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM page_fingerprints")
+    with op.batch_alter_table("page_fingerprints", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("simhash", sa.BigInteger(), nullable=False))
+        batch_op.add_column(sa.Column("contact_key", sa.String(length=32), nullable=True))
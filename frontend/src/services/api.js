@@ -67,6 +67,13 @@ export const deleteUser = (userId, token) =>
     }
   });
 
+export const getDashboardSummary = (token) =>
+  apiFetch('/api/dashboard/summary', {
+    headers: {
+      Authorization: `Bearer ${token}`
+    }
+  });
+
 export const getWebsites = (token) =>
   apiFetch('/api/dashboard/websites', {
     headers: {
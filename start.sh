@@ -20,6 +20,7 @@ trap cleanup EXIT
 
 echo "Starting FastAPI server..."
 source ./backend/.venv/bin/activate
+alembic -c backend/alembic.ini upgrade head
 uvicorn backend.app.main:app --reload &
 FASTAPI_PID=$!
 